@@ -49,21 +49,164 @@ Usage:
     python fix_errors.py analyze          # Run test analysis only
     python fix_errors.py suggest          # Generate fix suggestions only
     python fix_errors.py                  # Run both analysis and suggestions
+    python fix_errors.py --pretty         # Same, with indented JSON output files
 """
 
 import os
+import bisect
 import xml.etree.ElementTree as ET
-import glob
 import json
 import sys
+import time
 import argparse
-import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Set, Tuple
 import re
 from dotenv import load_dotenv
 
 
+# Imports that reference application classes, fused into one alternation so the
+# content is scanned once:
+#   svc - specific service/component patterns
+#   pkg - any import from the main application package (not test/framework)
+#   gen - generic application imports (framework packages are dropped by the
+#         _SKIP_IMPORT_KEYWORDS post-filter, so no lookbehinds are needed and
+#         the scan stays linear without backtracking)
+_IMPORT_COMBINED = re.compile(
+    r'import\s+(?:'
+    r'(?P<svc>[a-zA-Z0-9._]+(?:Service|Controller|Repository|Manager|Helper|Util|Component|Bean|DAO|Handler|Processor|Factory|Builder)[a-zA-Z0-9_]*)'
+    r'|(?P<pkg>[a-zA-Z0-9._]+(?:\.service\.|\.controller\.|\.repository\.|\.util\.|\.model\.|\.config\.)[a-zA-Z0-9._]+)'
+    r'|(?P<gen>(?:com|org|io|net)\.[a-zA-Z0-9._]+)'
+    r')\s*;'
+)
+_SKIP_IMPORT_KEYWORDS = frozenset(['test', 'junit', 'mockito', 'spring.test', 'hamcrest', 'assertj'])
+
+# Annotation followed by field declaration (handles multiple lines)
+_ANNOTATION_FIELD_PATTERNS = {
+    annotation: re.compile(
+        rf'{re.escape(annotation)}(?:\([^)]*\))?\s*(?:private|protected|public)?\s*([A-Z][a-zA-Z0-9_<>]+)\s+(\w+)\s*[;=]',
+        re.MULTILINE | re.DOTALL,
+    )
+    for annotation in ['@Autowired', '@Mock', '@InjectMocks', '@Inject', '@Resource']
+}
+
+_GENERIC_ARGS_RE = re.compile(r'<.*?>')
+_FIELD_ONLY_SUFFIXES = ('Service', 'Repository', 'Manager', 'DAO', 'Helper', 'Util', 'Handler')
+_FIELD_ONLY_RE = re.compile(
+    r'(?:private|protected|public)\s+([A-Z][a-zA-Z0-9_]+(?:' + '|'.join(_FIELD_ONLY_SUFFIXES) + r'))\s+(\w+)\s*[;=]'
+)
+_CONTEXT_CONFIG_RE = re.compile(r'@ContextConfiguration\s*\(\s*classes\s*=\s*\{?([^}]+)\}?\s*\)')
+_CLASS_LITERAL_RE = re.compile(r'([A-Z][a-zA-Z0-9_]+)\.class')
+_METHOD_CALL_RE = re.compile(r'(\w+)\.(\w+)\s*\(')
+_FIELD_DECL_RE = re.compile(r'(?:private|protected|public)?\s*([A-Z][a-zA-Z0-9_]+)\s+(\w+)\s*[;=]')
+_STACK_LOC_RE = re.compile(r'\(([^():\s]+):(\d+)\)')
+# "at [module/]package.Class.method(File.java:N)": group 1 is the package prefix, group 2 the class
+_STACK_AT_RE = re.compile(r'\bat[ \t]+(?:[\w.$-]+/)?((?:[\w$]+\.)*)([\w$]+)\.[\w$<>]+\([^)\n]*\.java:')
+_ASSERT_RE = re.compile(r'expected:\s*<(.*)>\s*but was:\s*<(.*)>')
+_LOG_IMPORTANT_RE = re.compile(
+    r'(ERROR|WARN|Exception:|Caused by|AssertionFailedError|expected:|actual:|\bFAIL(?:URE)?!?)',
+    re.IGNORECASE,
+)
+
+# Cheap lowercase substrings implied by every _LOG_IMPORTANT_RE match; lines
+# without any of them (the vast majority) skip the regex entirely
+_LOG_PREFILTER_TOKENS = ('error', 'warn', 'exception:', 'caused by', 'expected:', 'actual:', 'fail')
+
+# "count <op> N" comparisons flagged by the logic bug heuristics
+_COUNT_CMP_PATTERNS = {
+    operator: re.compile(rf'count\s*{re.escape(operator)}\s*(\d+)', re.IGNORECASE)
+    for operator in ('>', '>=', '<', '<=')
+}
+
+# Size/length keywords that mark a line as a collection size check
+_SIZE_KEYWORD_RE = re.compile(r'size\(\)|length|count|\.size|\.length\(\)')
+# Lines that can trigger any logic bug heuristic: an if statement, a comparison or a return
+_LOGIC_CANDIDATE_RE = re.compile(r'^(?=[^\S\n]*if|[^\n]*(?:[<>]|return))[^\n]*', re.MULTILINE)
+
+# Common test source directories
+_TEST_SOURCE_ROOTS = ("bank/src/test/java", "src/test/java", "test")
+
+# Below this many report files the process pool start-up outweighs the gain
+_PARALLEL_PARSE_MIN_FILES = 4
+
+# Responses larger than this are error pages or runaway output, not a chat completion
+_MAX_AI_RESPONSE_BYTES = 2_000_000
+
+# Section headings in the AI response ("**ROOT CAUSE**", "VERIFICATION:", ...); a
+# heading line opens a section that runs until the next heading line
+_AI_SECTION_RE = re.compile(
+    r'^[^\n]*?(?:\*\*(?P<bold>ROOT CAUSE|EXACT FIXES|VERIFICATION|ADDITIONAL NOTES)'
+    r'|(?P<colon>ROOT CAUSE|EXACT FIXES|VERIFICATION|ADDITIONAL NOTES):)[^\n]*$',
+    re.MULTILINE
+)
+
+
+# FILE/LINE/REPLACE/WITH labels of the fix blocks, matched one line at a time
+_AI_FIX_LABEL_RE = re.compile(
+    r'^[^\S\n]*(?P<label>FILE|LINE|REPLACE|WITH):[^\S\n]*(?P<rest>[^\n]*)',
+    re.MULTILINE
+)
+
+# A REPLACE/WITH value given as a fenced code block, on the label line or the next one
+_AI_FIX_BLOCK_RE = re.compile(
+    r'[^\S\n]*\n?[^\S\n]*```[\w+-]*[^\S\n]*\n(?P<block>.*?)\n[^\S\n]*```',
+    re.DOTALL
+)
+
+
+def _test_source_candidates(test_class: str, roots: Tuple[str, ...] = _TEST_SOURCE_ROOTS) -> List[str]:
+    """Return the test source locations under ``roots`` for a fully qualified test class."""
+    # Convert class name to file path
+    class_path = test_class.replace('.', '/') + '.java'
+    return [f"{root}/{class_path}" for root in roots]
+
+
+@lru_cache(maxsize=256)
+def _resolve_test_paths(test_class: str, roots: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the candidate test source paths for a class that exist on disk."""
+    return tuple(path for path in _test_source_candidates(test_class, roots) if os.path.isfile(path))
+
+
+@lru_cache(maxsize=256)
+def _read_java_source(path: str) -> Tuple[str, Tuple[str, ...], Tuple[int, ...]]:
+    """Read a Java source file once per run.
+
+    Returns the content, its lines and the offset at which each line starts so
+    that a match offset can be mapped to a line number with bisect.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    lines = tuple(content.split('\n'))
+    line_starts = (0, *accumulate(len(line) + 1 for line in lines[:-1]))
+    return content, lines, line_starts
+
+
+def _iter_java_files(directory: str):
+    """Yield (name, path) for every .java file below ``directory``.
+
+    Uses os.scandir so file types come from the directory listing itself. Files
+    are yielded before subdirectories are entered and symlinked directories are
+    not followed, matching the order of os.walk.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith('.java'):
+            yield entry.name, entry.path
+    for subdir in subdirs:
+        yield from _iter_java_files(subdir)
+
+
 class Logger:
     """Simple structured logger for consistent output formatting."""
 
@@ -89,32 +232,61 @@ class Logger:
 
 
 class TestFailure:
+    __slots__ = (
+        'test_class',
+        'test_method',
+        'failure_type',
+        'failure_message',
+        'stack_lines',
+        'execution_time',
+        'failure_category',
+        'raw_failure_excerpt',
+        'system_out',
+        'system_err',
+        'failure_location',
+    )
+
     def __init__(
         self,
         test_class: str,
         test_method: str,
         failure_type: str,
         failure_message: str,
-        stack_trace: str,
+        stack_lines: Tuple[str, ...],
         execution_time: float,
         failure_category: str,
-        raw_failure_text: str,
+        raw_failure_excerpt: Optional[str],
         system_out: str,
         system_err: str,
+        failure_location: Optional[Dict[str, Any]] = None,
     ):
         self.test_class = test_class
         self.test_method = test_method
         self.failure_type = failure_type
         self.failure_message = failure_message
-        self.stack_trace = stack_trace
+        self.stack_lines = stack_lines
         self.execution_time = execution_time
         self.failure_category = failure_category
-        self.raw_failure_text = raw_failure_text
+        self.raw_failure_excerpt = raw_failure_excerpt
         self.system_out = system_out
         self.system_err = system_err
+        self.failure_location = failure_location
 
 
 class TestSuiteResult:
+    __slots__ = (
+        'name',
+        'tests',
+        'failures',
+        'errors',
+        'skipped',
+        'time',
+        'report_file',
+        'test_failures',
+        'properties',
+        'suite_log_excerpt',
+    )
+
     def __init__(
         self,
         name: str,
@@ -137,19 +309,96 @@ class TestSuiteResult:
         self.suite_log_excerpt: Optional[str] = None
 
 
+def extract_test_dependencies(test_file_path: str) -> List[str]:
+    """Extract all service/component dependencies from test file."""
+    try:
+        mtime = os.path.getmtime(test_file_path)
+    except OSError:
+        return []
+    return list(_extract_test_dependencies_cached(test_file_path, mtime))
+
+
+@lru_cache(maxsize=128)
+def _extract_test_dependencies_cached(test_file_path: str, mtime: float) -> Tuple[str, ...]:
+    """Scan a test file for dependencies; keyed on mtime so edits invalidate the entry."""
+    dependencies = set()
+
+    try:
+        with open(test_file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Extract imports that reference application classes
+        for match in _IMPORT_COMBINED.finditer(content):
+            class_name = match.group(match.lastgroup)
+            # Skip test and framework imports
+            class_name_lower = class_name.lower()
+            if not any(skip in class_name_lower for skip in _SKIP_IMPORT_KEYWORDS):
+                dependencies.add(class_name)
+
+        # Extract @Autowired, @Mock, @InjectMocks field declarations (enhanced);
+        # a substring check skips the regex for annotations the file never uses
+        for annotation, pattern in _ANNOTATION_FIELD_PATTERNS.items():
+            if annotation not in content:
+                continue
+            for match in pattern.finditer(content):
+                class_type = match.group(1)
+                # Remove generics if present (e.g., List<String> -> List)
+                class_type = _GENERIC_ARGS_RE.sub('', class_type)
+                dependencies.add(class_type)
+
+        # Also look for field declarations without annotations but with service-like names
+        if any(suffix in content for suffix in _FIELD_ONLY_SUFFIXES):
+            for match in _FIELD_ONLY_RE.finditer(content):
+                class_type = match.group(1)
+                dependencies.add(class_type)
+
+        # Extract classes from @ContextConfiguration
+        if '@ContextConfiguration' in content:
+            for match in _CONTEXT_CONFIG_RE.finditer(content):
+                classes_str = match.group(1)
+                # Extract class names (e.g., SearchService.class -> SearchService)
+                class_names = _CLASS_LITERAL_RE.findall(classes_str)
+                dependencies.update(class_names)
+
+        # Extract method calls to find service usage (e.g., searchService.method()),
+        # resolving each receiver through a field name -> type map built in one pass
+        field_types: Dict[str, str] = {}
+        for match in _FIELD_DECL_RE.finditer(content):
+            field_types.setdefault(match.group(2), match.group(1))
+        for match in _METHOD_CALL_RE.finditer(content):
+            field_type = field_types.get(match.group(1))
+            if field_type:
+                dependencies.add(field_type)
+
+        return tuple(dependencies)
+
+    except Exception as e:
+        Logger.warn(f"Could not parse dependencies from {test_file_path}: {e}")
+        return tuple(dependencies)
+
+
 class MavenTestAnalyzer:
-    def __init__(self, reports_dir: str = "bank/target/surefire-reports"):
+    def __init__(self, reports_dir: str = "bank/target/surefire-reports", pretty_json: bool = False):
         self.reports_dir = reports_dir
+        self.pretty_json = pretty_json
         self.test_suites: List[TestSuiteResult] = []
         self.total_tests = 0
         self.total_failures = 0
         self.total_errors = 0
         self.total_skipped = 0
         self.total_time = 0.0
+        self._test_source_roots: Optional[Tuple[str, ...]] = None
 
     def parse_xml_reports(self):
         """Parse all XML test reports in the surefire-reports directory."""
-        xml_files = glob.glob(os.path.join(self.reports_dir, "TEST-*.xml"))
+        try:
+            with os.scandir(self.reports_dir) as entries:
+                xml_files = [
+                    entry.path for entry in entries
+                    if entry.name.startswith('TEST-') and entry.name.endswith('.xml') and entry.is_file()
+                ]
+        except FileNotFoundError:
+            xml_files = []
 
         if not xml_files:
             Logger.error(f"No XML test reports found in {self.reports_dir}")
@@ -157,16 +406,52 @@ class MavenTestAnalyzer:
 
         Logger.info(f"Found {len(xml_files)} test report files")
 
-        for xml_file in xml_files:
+        # Reports are independent, so parse them in worker processes when there
+        # are enough of them to amortize the pool start-up cost
+        executor = None
+        if len(xml_files) >= _PARALLEL_PARSE_MIN_FILES:
             try:
-                self._parse_single_xml_report(xml_file)
-            except Exception as e:
-                Logger.warn(f"Could not parse {xml_file}: {e}")
+                executor = ProcessPoolExecutor()
+            except (OSError, NotImplementedError) as e:
+                # Sandboxed hosts without /dev/shm or sem_open cannot start a pool
+                Logger.warn(f"Process pool unavailable, parsing reports serially: {e}")
+
+        if executor is None:
+            for xml_file in xml_files:
+                try:
+                    self._add_suite(self._parse_single_xml_report(xml_file))
+                except Exception as e:
+                    Logger.warn(f"Could not parse {xml_file}: {e}")
+            return
 
-    def _parse_single_xml_report(self, xml_file: str):
-        """Parse a single XML test report file."""
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+        with executor:
+            futures = [
+                executor.submit(_parse_xml_report_worker, self.reports_dir, xml_file)
+                for xml_file in xml_files
+            ]
+            for xml_file, future in zip(xml_files, futures):
+                try:
+                    self._add_suite(future.result())
+                except Exception as e:
+                    Logger.warn(f"Could not parse {xml_file}: {e}")
+
+    def _add_suite(self, suite: TestSuiteResult):
+        """Record a parsed suite and fold its counts into the run totals."""
+        self.total_tests += suite.tests
+        self.total_failures += suite.failures
+        self.total_errors += suite.errors
+        self.total_skipped += suite.skipped
+        self.total_time += suite.time
+        self.test_suites.append(suite)
+
+    def _parse_single_xml_report(self, xml_file: str) -> TestSuiteResult:
+        """Parse a single XML test report file.
+
+        The report is streamed with iterparse so each testcase, including its
+        system-out/system-err blocks, is released as soon as it is processed.
+        """
+        context = ET.iterparse(xml_file, events=('start', 'end'))
+        _, root = next(context)
 
         # Extract test suite information
         suite_name = root.get('name', 'Unknown')
@@ -178,195 +463,137 @@ class MavenTestAnalyzer:
 
         suite = TestSuiteResult(suite_name, tests, failures, errors, skipped, time, xml_file)
 
-        # Capture suite-level metadata
-        suite.properties = self._filter_properties(self._extract_suite_properties(root))
-        suite.suite_log_excerpt = self._load_suite_log_excerpt(xml_file)
-
-        # Update totals
-        self.total_tests += tests
-        self.total_failures += failures
-        self.total_errors += errors
-        self.total_skipped += skipped
-        self.total_time += time
-
-        # Parse individual test cases
-        for testcase in root.findall('.//testcase'):
-            test_name = testcase.get('name', 'Unknown')
-            test_class = testcase.get('classname', 'Unknown')
-            test_time = float(testcase.get('time', '0'))
-
-            # Check for failures
-            failure_elem = testcase.find('failure')
-            if failure_elem is not None:
-                failure_type = failure_elem.get('type', 'Unknown')
-                failure_text = failure_elem.text or ''
-                failure_message = failure_elem.get('message') or self._extract_failure_message(failure_text)
-                stack_trace = self._extract_stack_trace(failure_text)
-
-                failure = TestFailure(
-                    test_class=test_class,
-                    test_method=test_name,
-                    failure_type=failure_type,
-                    failure_message=failure_message,
-                    stack_trace=stack_trace,
-                    execution_time=test_time,
-                    failure_category='failure',
-                    raw_failure_text=failure_text,
-                    system_out=self._safe_strip(testcase.findtext('system-out')),
-                    system_err=self._safe_strip(testcase.findtext('system-err')),
-                )
-                suite.test_failures.append(failure)
-
-            # Check for errors
-            error_elem = testcase.find('error')
-            if error_elem is not None:
-                error_type = error_elem.get('type', 'Unknown')
-                error_text = error_elem.text or ''
-                error_message = error_elem.get('message') or self._extract_failure_message(error_text)
-                stack_trace = self._extract_stack_trace(error_text)
-
-                failure = TestFailure(
-                    test_class=test_class,
-                    test_method=test_name,
-                    failure_type=error_type,
-                    failure_message=error_message,
-                    stack_trace=stack_trace,
-                    execution_time=test_time,
-                    failure_category='error',
-                    raw_failure_text=error_text,
-                    system_out=self._safe_strip(testcase.findtext('system-out')),
-                    system_err=self._safe_strip(testcase.findtext('system-err')),
-                )
-                suite.test_failures.append(failure)
-
-        self.test_suites.append(suite)
+        depth = 0
+        for event, elem in context:
+            if event == 'start':
+                depth += 1
+                continue
 
-    def extract_test_dependencies(self, test_file_path: str) -> List[str]:
-        """Extract all service/component dependencies from test file."""
-        dependencies = []
+            depth -= 1
+            # Surefire reports are flat: testcases and properties are direct
+            # children of the suite, so nothing deeper needs handling here
+            if depth != 0:
+                continue
 
-        if not os.path.exists(test_file_path):
-            return dependencies
+            # Parse individual test cases
+            if elem.tag == 'testcase':
+                suite.test_failures.extend(self._parse_testcase(elem))
+            # Capture suite-level metadata
+            elif elem.tag == 'properties':
+                suite.properties = self._filter_properties(self._extract_suite_properties(elem))
 
-        try:
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract imports that reference application classes (enhanced patterns)
-            import_patterns = [
-                # Specific service/component patterns
-                r'import\s+([a-zA-Z0-9._]+(?:Service|Controller|Repository|Manager|Helper|Util|Component|Bean|DAO|Handler|Processor|Factory|Builder)[a-zA-Z0-9_]*)\s*;',
-                # Any import from the main application package (not test/framework)
-                r'import\s+([a-zA-Z0-9._]+(?:\.service\.|\.controller\.|\.repository\.|\.util\.|\.model\.|\.config\.)[a-zA-Z0-9._]+)\s*;',
-                # Generic application imports (avoid common framework packages)
-                r'import\s+((?:com|org|io|net)\.[a-zA-Z0-9._]+(?<!test)(?<!Test)(?<!junit)(?<!mockito)(?<!spring\.test))\s*;'
-            ]
+            # Drop processed children so the suite root never holds the whole report
+            root.clear()
 
-            for pattern in import_patterns:
-                for match in re.finditer(pattern, content):
-                    class_name = match.group(1)
-                    # Skip test and framework imports
-                    skip_keywords = ['test', 'junit', 'mockito', 'spring.test', 'hamcrest', 'assertj']
-                    if not any(skip in class_name.lower() for skip in skip_keywords):
-                        dependencies.append(class_name)
-
-            # Extract @Autowired, @Mock, @InjectMocks field declarations (enhanced)
-            dependency_annotations = ['@Autowired', '@Mock', '@InjectMocks', '@Inject', '@Resource']
-            for annotation in dependency_annotations:
-                # Enhanced pattern to match annotation followed by field declaration (handles multiple lines)
-                annotation_pattern = rf'{re.escape(annotation)}(?:\([^)]*\))?\s*'
-                field_pattern = rf'{annotation_pattern}(?:private|protected|public)?\s*([A-Z][a-zA-Z0-9_<>]+)\s+(\w+)\s*[;=]'
-                for match in re.finditer(field_pattern, content, re.MULTILINE | re.DOTALL):
-                    class_type = match.group(1)
-                    # Remove generics if present (e.g., List<String> -> List)
-                    class_type = re.sub(r'<.*?>', '', class_type)
-                    dependencies.append(class_type)
-
-            # Also look for field declarations without annotations but with service-like names
-            field_only_pattern = r'(?:private|protected|public)\s+([A-Z][a-zA-Z0-9_]+(?:Service|Repository|Manager|DAO|Helper|Util|Handler))\s+(\w+)\s*[;=]'
-            for match in re.finditer(field_only_pattern, content):
-                class_type = match.group(1)
-                dependencies.append(class_type)
+        suite.suite_log_excerpt = self._load_suite_log_excerpt(xml_file)
+        return suite
+
+    def _parse_testcase(self, testcase: ET.Element) -> List[TestFailure]:
+        """Extract failures and errors recorded on a single testcase element."""
+        test_failures = []
+        test_name = testcase.get('name', 'Unknown')
+        test_class = testcase.get('classname', 'Unknown')
+        test_time = float(testcase.get('time', '0'))
+
+        # Check for failures
+        failure_elem = testcase.find('failure')
+        if failure_elem is not None:
+            failure_type = failure_elem.get('type', 'Unknown')
+            failure_text = failure_elem.text or ''
+            first_line, stack_lines, location = self._split_failure(failure_text)
+            failure_message = failure_elem.get('message') or first_line
+
+            failure = TestFailure(
+                test_class=test_class,
+                test_method=test_name,
+                failure_type=failure_type,
+                failure_message=failure_message,
+                stack_lines=stack_lines,
+                execution_time=test_time,
+                failure_category='failure',
+                raw_failure_excerpt=self._raw_failure_excerpt(failure_text, failure_message),
+                system_out=self._safe_strip(testcase.findtext('system-out')),
+                system_err=self._safe_strip(testcase.findtext('system-err')),
+                failure_location=location,
+            )
+            test_failures.append(failure)
+
+        # Check for errors
+        error_elem = testcase.find('error')
+        if error_elem is not None:
+            error_type = error_elem.get('type', 'Unknown')
+            error_text = error_elem.text or ''
+            first_line, stack_lines, location = self._split_failure(error_text)
+            error_message = error_elem.get('message') or first_line
+
+            failure = TestFailure(
+                test_class=test_class,
+                test_method=test_name,
+                failure_type=error_type,
+                failure_message=error_message,
+                stack_lines=stack_lines,
+                execution_time=test_time,
+                failure_category='error',
+                raw_failure_excerpt=self._raw_failure_excerpt(error_text, error_message),
+                system_out=self._safe_strip(testcase.findtext('system-out')),
+                system_err=self._safe_strip(testcase.findtext('system-err')),
+                failure_location=location,
+            )
+            test_failures.append(failure)
 
-            # Extract classes from @ContextConfiguration
-            context_pattern = r'@ContextConfiguration\s*\(\s*classes\s*=\s*\{?([^}]+)\}?\s*\)'
-            for match in re.finditer(context_pattern, content):
-                classes_str = match.group(1)
-                # Extract class names (e.g., SearchService.class -> SearchService)
-                class_names = re.findall(r'([A-Z][a-zA-Z0-9_]+)\.class', classes_str)
-                dependencies.extend(class_names)
-
-            # Extract method calls to find service usage (e.g., searchService.method())
-            method_call_pattern = r'(\w+)\.(\w+)\s*\('
-            for match in re.finditer(method_call_pattern, content):
-                field_name = match.group(1)
-                # Find the type of this field by looking for its declaration
-                field_decl_pattern = rf'(?:private|protected|public)?\s*([A-Z][a-zA-Z0-9_]+)\s+{re.escape(field_name)}\s*[;=]'
-                field_match = re.search(field_decl_pattern, content)
-                if field_match:
-                    field_type = field_match.group(1)
-                    dependencies.append(field_type)
-
-            return list(set(dependencies))  # Remove duplicates
+        return test_failures
 
-        except Exception as e:
-            Logger.warn(f"Could not parse dependencies from {test_file_path}: {e}")
-            return dependencies
+    @staticmethod
+    def extract_test_dependencies(test_file_path: str) -> List[str]:
+        """Extract all service/component dependencies from test file."""
+        return extract_test_dependencies(test_file_path)
 
     def _get_test_source_info(self, test_class: str, test_method: str) -> Dict[str, Any]:
         """Try to find the source file for the test and extract relevant lines."""
-        # Convert class name to file path
-        class_path = test_class.replace('.', '/') + '.java'
-
-        # Common test source directories
-        possible_paths = [
-            f"bank/src/test/java/{class_path}",
-            f"src/test/java/{class_path}",
-            f"test/{class_path}"
-        ]
+        # Probe the candidate roots once per run; later lookups only stat files
+        # under the roots that actually exist
+        if self._test_source_roots is None:
+            self._test_source_roots = tuple(root for root in _TEST_SOURCE_ROOTS if os.path.isdir(root))
 
         notes = []
-        for path in possible_paths:
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Find the test method
-                    method_pattern = rf'(public|private|protected)?\s+void\s+{re.escape(test_method)}\s*\([^)]*\)'
-                    match = re.search(method_pattern, content)
-
-                    if match:
-                        lines = content.split('\n')
-                        method_line_index = content[:match.start()].count('\n')
-                        start_line = max(0, method_line_index - 5)
-                        end_line = min(len(lines), method_line_index + 30)
-
-                        method_context = '\n'.join(lines[start_line:end_line])
-                        return {
-                            'found': True,
-                            'path': path,
-                            'method_signature': lines[method_line_index].strip() if method_line_index < len(lines) else '',
-                            'context_start_line': start_line + 1,
-                            'context_end_line': end_line,
-                            'context': method_context,
-                        }
-                    else:
-                        notes.append(f"Method '{test_method}' not found in {path}")
-                except Exception as e:
-                    notes.append(f"Could not read source file {path}: {e}")
+        for path in _resolve_test_paths(test_class, self._test_source_roots):
+            try:
+                content, lines, line_starts = _read_java_source(path)
+
+                # Find the test method
+                method_pattern = rf'(public|private|protected)?\s+void\s+{re.escape(test_method)}\s*\([^)]*\)'
+                match = re.search(method_pattern, content)
+
+                if match:
+                    method_line_index = bisect.bisect_right(line_starts, match.start()) - 1
+                    start_line = max(0, method_line_index - 5)
+                    end_line = min(len(lines), method_line_index + 30)
+
+                    method_context = '\n'.join(lines[start_line:end_line])
+                    return {
+                        'found': True,
+                        'path': path,
+                        'method_signature': lines[method_line_index].strip() if method_line_index < len(lines) else '',
+                        'context_start_line': start_line + 1,
+                        'context_end_line': end_line,
+                        'context': method_context,
+                    }
+                else:
+                    notes.append(f"Method '{test_method}' not found in {path}")
+            except Exception as e:
+                notes.append(f"Could not read source file {path}: {e}")
 
         return {
             'found': False,
             'path': None,
             'context': None,
-            'searched_paths': possible_paths,
+            'searched_paths': _test_source_candidates(test_class),
             'notes': notes if notes else [f"Source file not found for {test_class}"],
         }
 
-    def _extract_suite_properties(self, root: ET.Element) -> Dict[str, str]:
+    def _extract_suite_properties(self, properties_elem: ET.Element) -> Dict[str, str]:
         properties = {}
-        for prop in root.findall('./properties/property'):
+        for prop in properties_elem.findall('property'):
             name = prop.get('name')
             value = prop.get('value')
             if name is not None and value is not None:
@@ -409,14 +636,11 @@ class MavenTestAnalyzer:
         if not text:
             return ''
         lines = [line.rstrip() for line in text.strip().splitlines()]
-        important = [
-            line for line in lines
-            if re.search(
-                r'(ERROR|WARN|Exception:|Caused by|AssertionFailedError|expected:|actual:|\bFAIL(?:URE)?!?)',
-                line,
-                re.IGNORECASE,
-            )
-        ]
+        important = []
+        for line in lines:
+            line_lower = line.lower()
+            if any(token in line_lower for token in _LOG_PREFILTER_TOKENS) and _LOG_IMPORTANT_RE.search(line):
+                important.append(line)
 
         if not important:
             return ''
@@ -440,41 +664,45 @@ class MavenTestAnalyzer:
             return ''
         return value.strip()
 
-    @staticmethod
-    def _extract_failure_message(raw_text: str) -> str:
-        if not raw_text:
-            return ''
-        first_line = raw_text.strip().splitlines()[0]
-        return first_line.strip()
-
-    @staticmethod
-    def _extract_stack_trace(raw_text: str) -> str:
-        if not raw_text:
-            return ''
-        lines = raw_text.strip().splitlines()
-        if len(lines) <= 1:
-            return raw_text.strip()
-        return '\n'.join(lines[1:]).strip()
+    @classmethod
+    def _raw_failure_excerpt(cls, raw_text: str, failure_message: str) -> Optional[str]:
+        """Keep a short excerpt of the raw failure text when it adds to the message."""
+        if raw_text and raw_text.strip() != failure_message:
+            return cls._truncate_text(raw_text, 400)
+        return None
 
     @staticmethod
-    def _extract_failure_location(stack_trace: str) -> Optional[Dict[str, Any]]:
-        if not stack_trace:
-            return None
-        for line in stack_trace.splitlines():
-            match = re.search(r'\(([^():\s]+):(\d+)\)', line)
+    def _split_failure(raw_text: str) -> Tuple[str, Tuple[str, ...], Optional[Dict[str, Any]]]:
+        """Split raw failure text into its first line, stack trace lines and failure location.
+
+        The stack trace is kept as lines and only joined when the summary is
+        serialized, so location extraction never has to re-split it.
+        """
+        lines = raw_text.strip().splitlines() if raw_text else []
+        if not lines:
+            return '', (), None
+
+        message = lines[0].strip()
+        stack_lines = tuple(lines if len(lines) <= 1 else lines[1:])
+
+        location = None
+        for line in stack_lines:
+            match = _STACK_LOC_RE.search(line)
             if match:
-                return {
+                location = {
                     'file': match.group(1),
                     'line': int(match.group(2)),
                     'stack_line': line.strip(),
                 }
-        return None
+                break
+
+        return message, stack_lines, location
 
     @staticmethod
     def _extract_assertion_details(message: str) -> Optional[Dict[str, Any]]:
         if not message:
             return None
-        match = re.search(r'expected:\s*<(.*)>\s*but was:\s*<(.*)>', message)
+        match = _ASSERT_RE.search(message)
         if match:
             return {
                 'expected': match.group(1),
@@ -482,8 +710,63 @@ class MavenTestAnalyzer:
             }
         return None
 
+    def _build_suite_dict(self, suite: TestSuiteResult) -> Dict[str, Any]:
+        """Build the JSON-ready entry for a single suite, including failure context."""
+        suite_dict: Dict[str, Any] = {
+            'name': suite.name,
+            'report_file': suite.report_file,
+            'tests': suite.tests,
+            'failures': suite.failures,
+            'errors': suite.errors,
+            'skipped': suite.skipped,
+            'time_seconds': round(suite.time, 3),
+            'status': 'PASSED' if (suite.failures + suite.errors) == 0 else 'FAILED',
+            'failures': [],
+        }
+
+        for failure in suite.test_failures:
+            assertion_details = self._extract_assertion_details(failure.failure_message)
+
+            failure_dict: Dict[str, Any] = {
+                'test_class': failure.test_class,
+                'test_method': failure.test_method,
+                'failure_type': failure.failure_type,
+                'failure_category': failure.failure_category,
+                'execution_time_seconds': round(failure.execution_time, 3),
+                'failure_message': failure.failure_message,
+                'stack_trace': '\n'.join(failure.stack_lines).strip(),
+                'failure_location': failure.failure_location,
+                'assertion_details': assertion_details,
+                'system_out_excerpt': self._extract_relevant_log(failure.system_out, 400),
+                'system_err_excerpt': self._extract_relevant_log(failure.system_err, 400),
+                'test_source': self._get_test_source_info(failure.test_class, failure.test_method),
+            }
+
+            if failure.raw_failure_excerpt:
+                failure_dict['raw_failure_excerpt'] = failure.raw_failure_excerpt
+
+            suite_dict['failures'].append(failure_dict)
+
+        if suite.properties:
+            suite_dict['environment'] = suite.properties
+        if suite.suite_log_excerpt:
+            suite_dict['suite_log_excerpt'] = suite.suite_log_excerpt
+
+        return suite_dict
+
+    def _json_fragment(self, value: Any, level: int) -> str:
+        """Serialize a value as JSON nested ``level`` levels deep in the summary."""
+        if not self.pretty_json:
+            return json.dumps(value, separators=(',', ':'))
+        # Encoded strings never contain raw newlines, so every newline is structural
+        return json.dumps(value, indent=2).replace('\n', '\n' + '  ' * level)
+
     def generate_failures_summary(self, output_file: str = "output/error-summary.json"):
-        """Generate a comprehensive failures summary for LLM analysis in JSON."""
+        """Generate a comprehensive failures summary for LLM analysis in JSON.
+
+        Suites are serialized and written one at a time so the full report never
+        has to be held in memory as both Python objects and encoded text.
+        """
         success_count = self.total_tests - self.total_failures - self.total_errors
         success_rate = (
             (success_count / self.total_tests * 100)
@@ -491,86 +774,52 @@ class MavenTestAnalyzer:
             else 0.0
         )
 
-        report_payload: Dict[str, Any] = {
-            'metadata': {
-                'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'reports_directory': self.reports_dir,
-                'total_suites': len(self.test_suites),
-            },
-            'summary': {
-                'total_tests': self.total_tests,
-                'total_failures': self.total_failures,
-                'total_errors': self.total_errors,
-                'total_skipped': self.total_skipped,
-                'total_time_seconds': round(self.total_time, 3),
-                'successful_tests': success_count,
-                'success_rate_percent': round(success_rate, 2),
-            },
-            'suites': [],
-            'analysis_guidance': {
-                'prompt': (
-                    "Analyze the failing Maven Surefire tests, explain the root cause for each "
-                    "failure, recommend precise code/configuration fixes, and highlight regression "
-                    "risks or missing test coverage."
-                ),
-                'suggested_steps': [
-                    'Review each failure entry, paying attention to stack traces and assertion details.',
-                    'Use the source context to pinpoint the code under test and propose updates.',
-                    'Validate whether external dependencies, data fixtures, or configuration need adjustments.',
-                    'Recommend additional tests or assertions to prevent future regressions.',
-                ],
-            },
+        metadata = {
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'reports_directory': self.reports_dir,
+            'total_suites': len(self.test_suites),
+        }
+        summary = {
+            'total_tests': self.total_tests,
+            'total_failures': self.total_failures,
+            'total_errors': self.total_errors,
+            'total_skipped': self.total_skipped,
+            'total_time_seconds': round(self.total_time, 3),
+            'successful_tests': success_count,
+            'success_rate_percent': round(success_rate, 2),
+        }
+        analysis_guidance = {
+            'prompt': (
+                "Analyze the failing Maven Surefire tests, explain the root cause for each "
+                "failure, recommend precise code/configuration fixes, and highlight regression "
+                "risks or missing test coverage."
+            ),
+            'suggested_steps': [
+                'Review each failure entry, paying attention to stack traces and assertion details.',
+                'Use the source context to pinpoint the code under test and propose updates.',
+                'Validate whether external dependencies, data fixtures, or configuration need adjustments.',
+                'Recommend additional tests or assertions to prevent future regressions.',
+            ],
         }
 
-        for suite in self.test_suites:
-            suite_dict: Dict[str, Any] = {
-                'name': suite.name,
-                'report_file': suite.report_file,
-                'tests': suite.tests,
-                'failures': suite.failures,
-                'errors': suite.errors,
-                'skipped': suite.skipped,
-                'time_seconds': round(suite.time, 3),
-                'status': 'PASSED' if (suite.failures + suite.errors) == 0 else 'FAILED',
-                'failures': [],
-            }
-
-            for failure in suite.test_failures:
-                source_info = self._get_test_source_info(failure.test_class, failure.test_method)
-                failure_location = self._extract_failure_location(failure.stack_trace)
-                assertion_details = self._extract_assertion_details(
-                    failure.failure_message or failure.raw_failure_text
-                )
-
-                failure_dict: Dict[str, Any] = {
-                    'test_class': failure.test_class,
-                    'test_method': failure.test_method,
-                    'failure_type': failure.failure_type,
-                    'failure_category': failure.failure_category,
-                    'execution_time_seconds': round(failure.execution_time, 3),
-                    'failure_message': failure.failure_message,
-                    'stack_trace': failure.stack_trace,
-                    'failure_location': failure_location,
-                    'assertion_details': assertion_details,
-                    'system_out_excerpt': self._extract_relevant_log(failure.system_out, 400),
-                    'system_err_excerpt': self._extract_relevant_log(failure.system_err, 400),
-                    'test_source': source_info,
-                }
-
-                if failure.raw_failure_text and failure.raw_failure_text.strip() != failure.failure_message:
-                    failure_dict['raw_failure_excerpt'] = self._truncate_text(failure.raw_failure_text, 400)
-
-                suite_dict['failures'].append(failure_dict)
-
-            if suite.properties:
-                suite_dict['environment'] = suite.properties
-            if suite.suite_log_excerpt:
-                suite_dict['suite_log_excerpt'] = suite.suite_log_excerpt
-
-            report_payload['suites'].append(suite_dict)
+        # Compact output is the default since the summary is machine-read;
+        # pretty_json reproduces json.dump(..., indent=2) layout
+        if self.pretty_json:
+            newline, indent, colon = '\n', '  ', ': '
+        else:
+            newline, indent, colon = '', '', ':'
 
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report_payload, f, indent=2)
+            f.write('{' + newline)
+            f.write(f'{indent}"metadata"{colon}{self._json_fragment(metadata, 1)},{newline}')
+            f.write(f'{indent}"summary"{colon}{self._json_fragment(summary, 1)},{newline}')
+            f.write(f'{indent}"suites"{colon}[')
+            for index, suite in enumerate(self.test_suites):
+                f.write((',' if index else '') + newline + indent * 2)
+                f.write(self._json_fragment(self._build_suite_dict(suite), 2))
+            f.write((newline + indent if self.test_suites else '') + '],' + newline)
+            f.write(f'{indent}"analysis_guidance"{colon}{self._json_fragment(analysis_guidance, 1)}{newline}')
+            f.write('}')
 
         Logger.info(f"Summary saved to {output_file}")
 
@@ -590,13 +839,14 @@ class MavenTestAnalyzer:
             return False
 
         self.generate_failures_summary()
+        has_failures = self.total_failures > 0 or self.total_errors > 0
 
         success_count = self.total_tests - self.total_failures - self.total_errors
         success_rate = (success_count / self.total_tests * 100) if self.total_tests > 0 else 0
 
         Logger.info(f"Analysis complete: {self.total_tests} tests, {self.total_failures} failures, {self.total_errors} errors ({success_rate:.0f}% pass rate)")
 
-        if self.total_failures > 0 or self.total_errors > 0:
+        if has_failures:
             Logger.info("Summary saved to 'output/error-summary.json'")
             return True
         else:
@@ -604,174 +854,72 @@ class MavenTestAnalyzer:
             return False
 
 
+def _parse_xml_report_worker(reports_dir: str, xml_file: str) -> TestSuiteResult:
+    """Process pool entry point that parses one report file in a worker."""
+    return MavenTestAnalyzer(reports_dir)._parse_single_xml_report(xml_file)
+
+
 class FixSuggester:
-    def __init__(self):
+    def __init__(self, pretty_json: bool = False):
         load_dotenv()
         self.api_key = os.getenv("IBM_API_KEY")
         if not self.api_key:
             Logger.error("IBM_API_KEY not found in environment variables")
             Logger.error("Please check your .env file")
             sys.exit(1)
+        self.pretty_json = pretty_json
+        self._related_cache: Dict[Tuple[str, Optional[str], str], List[str]] = {}
+        self._source_dirs: Optional[List[str]] = None
 
-    def extract_test_dependencies(self, test_file_path: str) -> List[str]:
-        """Extract all service/component dependencies from test file."""
-        dependencies = []
-
-        if not os.path.exists(test_file_path):
-            return dependencies
-
-        try:
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract imports that reference application classes (enhanced patterns)
-            import_patterns = [
-                # Specific service/component patterns
-                r'import\s+([a-zA-Z0-9._]+(?:Service|Controller|Repository|Manager|Helper|Util|Component|Bean|DAO|Handler|Processor|Factory|Builder)[a-zA-Z0-9_]*)\s*;',
-                # Any import from the main application package (not test/framework)
-                r'import\s+([a-zA-Z0-9._]+(?:\.service\.|\.controller\.|\.repository\.|\.util\.|\.model\.|\.config\.)[a-zA-Z0-9._]+)\s*;',
-                # Generic application imports (avoid common framework packages)
-                r'import\s+((?:com|org|io|net)\.[a-zA-Z0-9._]+(?<!test)(?<!Test)(?<!junit)(?<!mockito)(?<!spring\.test))\s*;'
-            ]
-
-            for pattern in import_patterns:
-                for match in re.finditer(pattern, content):
-                    class_name = match.group(1)
-                    # Skip test and framework imports
-                    skip_keywords = ['test', 'junit', 'mockito', 'spring.test', 'hamcrest', 'assertj']
-                    if not any(skip in class_name.lower() for skip in skip_keywords):
-                        dependencies.append(class_name)
-
-            # Extract @Autowired, @Mock, @InjectMocks field declarations (enhanced)
-            dependency_annotations = ['@Autowired', '@Mock', '@InjectMocks', '@Inject', '@Resource']
-            for annotation in dependency_annotations:
-                # Enhanced pattern to match annotation followed by field declaration (handles multiple lines)
-                annotation_pattern = rf'{re.escape(annotation)}(?:\([^)]*\))?\s*'
-                field_pattern = rf'{annotation_pattern}(?:private|protected|public)?\s*([A-Z][a-zA-Z0-9_<>]+)\s+(\w+)\s*[;=]'
-                for match in re.finditer(field_pattern, content, re.MULTILINE | re.DOTALL):
-                    class_type = match.group(1)
-                    # Remove generics if present (e.g., List<String> -> List)
-                    class_type = re.sub(r'<.*?>', '', class_type)
-                    dependencies.append(class_type)
-
-            # Also look for field declarations without annotations but with service-like names
-            field_only_pattern = r'(?:private|protected|public)\s+([A-Z][a-zA-Z0-9_]+(?:Service|Repository|Manager|DAO|Helper|Util|Handler))\s+(\w+)\s*[;=]'
-            for match in re.finditer(field_only_pattern, content):
-                class_type = match.group(1)
-                dependencies.append(class_type)
-
-            # Extract classes from @ContextConfiguration
-            context_pattern = r'@ContextConfiguration\s*\(\s*classes\s*=\s*\{?([^}]+)\}?\s*\)'
-            for match in re.finditer(context_pattern, content):
-                classes_str = match.group(1)
-                # Extract class names (e.g., SearchService.class -> SearchService)
-                class_names = re.findall(r'([A-Z][a-zA-Z0-9_]+)\.class', classes_str)
-                dependencies.extend(class_names)
-
-            # Extract method calls to find service usage (e.g., searchService.method())
-            method_call_pattern = r'(\w+)\.(\w+)\s*\('
-            for match in re.finditer(method_call_pattern, content):
-                field_name = match.group(1)
-                # Find the type of this field by looking for its declaration
-                field_decl_pattern = rf'(?:private|protected|public)?\s*([A-Z][a-zA-Z0-9_]+)\s+{re.escape(field_name)}\s*[;=]'
-                field_match = re.search(field_decl_pattern, content)
-                if field_match:
-                    field_type = field_match.group(1)
-                    dependencies.append(field_type)
-
-            return list(set(dependencies))  # Remove duplicates
-
-        except Exception as e:
-            Logger.warn(f"Could not parse dependencies from {test_file_path}: {e}")
-            return dependencies
-
-    def analyze_code_for_logic_bugs(self, source_code: str, failure_details: Dict) -> List[Dict]:
-        """Analyze source code for potential logic bugs based on test expectations."""
-        potential_bugs = []
+        # Created on first use by _get_http so the analysis paths never import requests
+        self._http = None
 
-        if not source_code or not failure_details:
-            return potential_bugs
+        self._token: Optional[str] = None
+        self._token_exp = 0.0
 
-        lines = source_code.split('\n')
-        assertion_details = failure_details.get('assertion_details', {})
-        expected = assertion_details.get('expected')
-        actual = assertion_details.get('actual')
+    def extract_test_dependencies(self, test_file_path: str) -> List[str]:
+        """Extract all service/component dependencies from test file."""
+        return extract_test_dependencies(test_file_path)
+
+    def _get_http(self):
+        """Return the pooled session shared by the IAM and watsonx.ai calls."""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # One pooled session for IAM and watsonx.ai so the TLS connection is reused
+            self._http = requests.Session()
+            self._http.headers['User-Agent'] = 'digibank-fix/1.0'
+            # Generation POSTs are not idempotent: only retry failed connects and
+            # rejections the server never processed, never read timeouts or 5xx
+            retry = Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=[429, 503],
+                          allowed_methods=frozenset({'POST'}))
+            self._http.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+        return self._http
 
-        # Look for suspicious conditions when we expect a specific count but get 0
-        if expected and actual == '0':
-            try:
-                expected_count = int(expected)
-                if expected_count > 0:
-                    # Search for problematic conditional statements
-                    for i, line in enumerate(lines):
-                        line_clean = line.strip()
-
-                        # Look for if statements with count comparisons
-                        if line_clean.startswith('if') and 'count' in line_clean.lower():
-                            # Check for common logic errors
-                            for operator in ['>', '>=', '<', '<=']:
-                                if operator in line_clean:
-                                    # Extract the comparison value
-                                    try:
-                                        # Simple pattern matching for "if (count > N)"
-                                        match = re.search(rf'count\s*{re.escape(operator)}\s*(\d+)', line_clean, re.IGNORECASE)
-                                        if match:
-                                            comparison_value = int(match.group(1))
-
-                                            # Flag potential off-by-one errors
-                                            if operator in ['>', '>='] and comparison_value >= expected_count:
-                                                potential_bugs.append({
-                                                    'line_number': i + 1,
-                                                    'line_content': line_clean,
-                                                    'bug_type': 'off_by_one_error',
-                                                    'description': f'Condition requires count {operator} {comparison_value}, but test expects {expected_count} items',
-                                                    'suggested_fix': f'Change to "count > 0" or "count >= {expected_count}"',
-                                                    'confidence': 'high'
-                                                })
-                                    except (ValueError, AttributeError):
-                                        continue
-
-                        # Look for array/list size checks that might cause empty returns
-                        size_keywords = ['size()', 'length', 'count', '.size', '.length()']
-                        for keyword in size_keywords:
-                            if keyword in line_clean.lower() and any(op in line_clean for op in ['>', '<', '>=', '<=']):
-                                potential_bugs.append({
-                                    'line_number': i + 1,
-                                    'line_content': line_clean,
-                                    'bug_type': 'size_check_error',
-                                    'description': f'Size check on line {i + 1} might prevent returning expected {expected_count} items',
-                                    'suggested_fix': 'Review the size comparison logic',
-                                    'confidence': 'medium'
-                                })
-
-                        # Look for empty return statements in conditional blocks
-                        if ('return' in line_clean and
-                            ('empty' in line_clean.lower() or 'new arraylist()' in line_clean.lower() or
-                             'collections.emptylist()' in line_clean.lower() or 'return [];' in line_clean)):
-                            potential_bugs.append({
-                                'line_number': i + 1,
-                                'line_content': line_clean,
-                                'bug_type': 'empty_return',
-                                'description': 'Empty return statement might be executed when data should be returned',
-                                'suggested_fix': 'Check if this return should be conditional',
-                                'confidence': 'medium'
-                            })
-
-            except ValueError:
-                pass  # expected is not a number
+    def get_access_token(self):
+        """Get IBM Cloud access token using API key, reusing it until shortly before it expires."""
+        import requests
 
-        return potential_bugs
+        if self._token and time.time() < self._token_exp:
+            return self._token
 
-    def get_access_token(self):
-        """Get IBM Cloud access token using API key."""
         url = "https://iam.cloud.ibm.com/identity/token"
         payload = f"grant_type=urn:ibm:params:oauth:grant-type:apikey&apikey={self.api_key}"
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
         try:
-            response = requests.post(url, data=payload, headers=headers)
+            response = self._get_http().post(url, data=payload, headers=headers, timeout=(3, 10))
             response.raise_for_status()
-            return response.json()["access_token"]
+            token_data = response.json()
+            self._token = token_data["access_token"]
+            # Refresh a minute early so the token cannot expire mid-request
+            self._token_exp = time.time() + token_data.get("expires_in", 3600) - 60
+            return self._token
+        except requests.exceptions.Timeout:
+            Logger.error("Timed out getting access token")
+            sys.exit(1)
         except requests.exceptions.RequestException as e:
             Logger.error(f"Failed to get access token: {e}")
             sys.exit(1)
@@ -792,11 +940,21 @@ class FixSuggester:
             Logger.error(f"Error parsing {file_path}: {e}")
             sys.exit(1)
 
-    def load_source_code(self, file_path: str) -> str:
-        """Load source code from a file for analysis."""
+    def load_source_code(self, file_path: str, max_bytes: int = 200_000) -> str:
+        """Load source code from a file for analysis, keeping at most max_bytes characters.
+
+        Truncated files end with a marker comment so the model knows the source is partial.
+        """
         try:
+            if os.path.getsize(file_path) > max_bytes * 4:
+                Logger.warn(f"Skipping {file_path}: file too large to include in the prompt")
+                return ""
             with open(file_path, 'r') as file:
-                return file.read()
+                source_code = file.read(max_bytes + 1)
+            if len(source_code) > max_bytes:
+                Logger.warn(f"Truncated {file_path} to {max_bytes} characters for the prompt")
+                return source_code[:max_bytes] + f"\n// ... truncated at {max_bytes} chars"
+            return source_code
         except FileNotFoundError:
             Logger.warn(f"Source file {file_path} not found")
             return ""
@@ -804,9 +962,37 @@ class FixSuggester:
             Logger.warn(f"Could not read {file_path}: {e}")
             return ""
 
+    def _get_source_dirs(self) -> List[str]:
+        """Detect the Java source directories once per instance."""
+        if self._source_dirs is None:
+            source_dirs = []
+            possible_source_roots = [".", "bank", "src", "main"]
+            for root in possible_source_roots:
+                for subdir in ["src/main/java", "main/java", "java"]:
+                    potential_dir = os.path.join(root, subdir) if root != "." else subdir
+                    if os.path.isdir(potential_dir):
+                        source_dirs.append(potential_dir)
+
+            # Remove duplicates while preserving order
+            self._source_dirs = list(dict.fromkeys(source_dirs))
+        return self._source_dirs
+
     def find_related_source_files(self, test_class: str, failure_message: str, stack_trace: str, test_file_path: str = None) -> List[str]:
         """Find related source files based on test class name, failure message, stack trace, and test dependencies."""
+        # Failures from the same test class usually share a stack shape, so reuse
+        # earlier directory walks (the failure message does not affect the result)
+        cache_key = (test_class, test_file_path, stack_trace or '')
+        cached = self._related_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Nothing can match outside a Java source tree, so skip the pattern building
+        source_dirs = self._get_source_dirs()
+        if not source_dirs:
+            return []
+
         related_files = []
+        seen: Set[str] = set()
         all_dependencies = set()
 
         # 1. Extract dependencies from test file if available
@@ -826,21 +1012,13 @@ class FixSuggester:
         # 3. Look for classes mentioned in stack trace
         stack_classes = set()
         if stack_trace:
-            for line in stack_trace.split('\n'):
-                # Find class references in stack trace (e.g., at com.example.Service.method(Service.java:123))
-                if 'at ' in line and '.java:' in line:
-                    try:
-                        class_part = line.split('at ')[1].split('(')[0]
-                        # Extract full class name, not just the last part
-                        full_class_name = class_part.rsplit('.', 1)[0]  # Remove method name
-                        class_name = class_part.split('.')[-2] if '.' in class_part else None
-                        if class_name and not class_name.endswith('Test'):
-                            stack_classes.add(class_name)
-                            # Also add the full class name for better matching
-                            if full_class_name and not full_class_name.endswith('Test'):
-                                all_dependencies.add(full_class_name)
-                    except (IndexError, AttributeError):
-                        continue
+            # Find class references in stack trace (e.g., at com.example.Service.method(Service.java:123))
+            for match in _STACK_AT_RE.finditer(stack_trace):
+                class_name = match.group(2)
+                if not class_name.endswith('Test'):
+                    stack_classes.add(class_name)
+                    # Also add the full class name for better matching
+                    all_dependencies.add(match.group(1) + class_name)
 
         # 4. Common source file patterns to search for
         search_patterns = [
@@ -864,29 +1042,17 @@ class FixSuggester:
                 # Simple class name
                 search_patterns.append(dependency)
 
-        # 6. Dynamically detect source directories
-        source_dirs = []
-        possible_source_roots = [".", "bank", "src", "main"]
-        for root in possible_source_roots:
-            for subdir in ["src/main/java", "main/java", "java"]:
-                potential_dir = os.path.join(root, subdir) if root != "." else subdir
-                if os.path.exists(potential_dir):
-                    source_dirs.append(potential_dir)
-
-        # Remove duplicates while preserving order
-        source_dirs = list(dict.fromkeys(source_dirs))
+        # 6. Source directories were detected on entry (see _get_source_dirs)
 
-        # 7. Search for files by pattern matching
+        # 7. Search for files by pattern matching, walking each source tree once
         for source_dir in source_dirs:
-            if os.path.exists(source_dir):
-                for pattern in search_patterns:
-                    # Use glob to find matching files
-                    for root, dirs, files in os.walk(source_dir):
-                        for file in files:
-                            if file.endswith('.java') and pattern in file:
-                                full_path = os.path.join(root, file)
-                                if full_path not in related_files:
-                                    related_files.append(full_path)
+            java_index = list(_iter_java_files(source_dir))
+
+            for pattern in search_patterns:
+                for file, full_path in java_index:
+                    if pattern in file and full_path not in seen:
+                        seen.add(full_path)
+                        related_files.append(full_path)
 
         # 8. Search for files by full package name (more precise)
         for dependency in all_dependencies:
@@ -895,7 +1061,8 @@ class FixSuggester:
                 package_path = dependency.replace('.', '/') + '.java'
                 for source_dir in source_dirs:
                     potential_file = os.path.join(source_dir, package_path)
-                    if os.path.exists(potential_file) and potential_file not in related_files:
+                    if potential_file not in seen and os.path.exists(potential_file):
+                        seen.add(potential_file)
                         related_files.append(potential_file)
 
         # 9. Search for files in same package as test
@@ -913,14 +1080,17 @@ class FixSuggester:
                 package_path = main_package.replace('.', '/')
                 for source_dir in source_dirs:
                     package_dir = os.path.join(source_dir, package_path)
-                    if os.path.exists(package_dir):
-                        for file in os.listdir(package_dir):
-                            if file.endswith('.java'):
-                                full_path = os.path.join(package_dir, file)
-                                if full_path not in related_files:
-                                    related_files.append(full_path)
+                    try:
+                        with os.scandir(package_dir) as it:
+                            for entry in it:
+                                if entry.name.endswith('.java') and entry.path not in seen:
+                                    seen.add(entry.path)
+                                    related_files.append(entry.path)
+                    except OSError:
+                        continue
 
-        return related_files
+        self._related_cache[cache_key] = related_files
+        return list(related_files)
 
     def analyze_code_for_logic_bugs(self, source_code: str, failure_details: Dict) -> List[Dict]:
         """Analyze source code for potential logic bugs based on test expectations."""
@@ -929,168 +1099,196 @@ class FixSuggester:
         if not source_code or not failure_details:
             return potential_bugs
 
-        lines = source_code.split('\n')
-        assertion_details = failure_details.get('assertion_details', {})
+        # Only an "expected N but got 0" assertion is worth scanning the source for
+        assertion_details = failure_details.get('assertion_details') or {}
         expected = assertion_details.get('expected')
         actual = assertion_details.get('actual')
+        if not expected or actual != '0':
+            return potential_bugs
+        try:
+            expected_count = int(expected)
+        except (TypeError, ValueError):
+            return potential_bugs  # expected is not a number
+        if expected_count <= 0:
+            return potential_bugs
 
-        # Look for suspicious conditions when we expect a specific count but get 0
-        if expected and actual == '0':
-            try:
-                expected_count = int(expected)
-                if expected_count > 0:
-                    # Search for problematic conditional statements
-                    for i, line in enumerate(lines):
-                        line_clean = line.strip()
-
-                        # Look for if statements with count comparisons
-                        if line_clean.startswith('if') and 'count' in line_clean.lower():
-                            # Check for common logic errors
-                            for operator in ['>', '>=', '<', '<=']:
-                                if operator in line_clean:
-                                    # Extract the comparison value
-                                    try:
-                                        # Simple pattern matching for "if (count > N)"
-                                        match = re.search(rf'count\s*{re.escape(operator)}\s*(\d+)', line_clean, re.IGNORECASE)
-                                        if match:
-                                            comparison_value = int(match.group(1))
-
-                                            # Flag potential off-by-one errors
-                                            if operator in ['>', '>='] and comparison_value >= expected_count:
-                                                potential_bugs.append({
-                                                    'line_number': i + 1,
-                                                    'line_content': line_clean,
-                                                    'bug_type': 'off_by_one_error',
-                                                    'description': f'Condition requires count {operator} {comparison_value}, but test expects {expected_count} items',
-                                                    'suggested_fix': f'Change to "count > 0" or "count >= {expected_count}"',
-                                                    'confidence': 'high'
-                                                })
-                                    except (ValueError, AttributeError):
-                                        continue
-
-                        # Look for array/list size checks that might cause empty returns
-                        size_keywords = ['size()', 'length', 'count', '.size', '.length()']
-                        for keyword in size_keywords:
-                            if keyword in line_clean.lower() and any(op in line_clean for op in ['>', '<', '>=', '<=']):
-                                potential_bugs.append({
-                                    'line_number': i + 1,
-                                    'line_content': line_clean,
-                                    'bug_type': 'size_check_error',
-                                    'description': f'Size check on line {i + 1} might prevent returning expected {expected_count} items',
-                                    'suggested_fix': 'Review the size comparison logic',
-                                    'confidence': 'medium'
-                                })
-
-                        # Look for empty return statements in conditional blocks
-                        if ('return' in line_clean and
-                            ('empty' in line_clean.lower() or 'new arraylist()' in line_clean.lower() or
-                             'collections.emptylist()' in line_clean.lower() or 'return [];' in line_clean)):
-                            potential_bugs.append({
-                                'line_number': i + 1,
-                                'line_content': line_clean,
-                                'bug_type': 'empty_return',
-                                'description': 'Empty return statement might be executed when data should be returned',
-                                'suggested_fix': 'Check if this return should be conditional',
-                                'confidence': 'medium'
-                            })
-
-            except ValueError:
-                pass  # expected is not a number
+        # Let the regex engine pick out candidate lines, then classify only those;
+        # the cheap character and substring guards decide which heuristics run
+        line_number = 1
+        last_offset = 0
+        for candidate in _LOGIC_CANDIDATE_RE.finditer(source_code):
+            line_number += source_code.count('\n', last_offset, candidate.start())
+            last_offset = candidate.start()
+            line_clean = candidate.group().strip()
+            line_lower = line_clean.lower()
+
+            # Look for if statements with count comparisons
+            if line_clean[0] == 'i' and line_clean.startswith('if') and 'count' in line_lower:
+                potential_bugs.extend(
+                    self._count_comparison_bugs(line_clean, line_number, expected_count)
+                )
+
+            # Look for array/list size checks that might cause empty returns
+            if ('<' in line_clean or '>' in line_clean) and _SIZE_KEYWORD_RE.search(line_lower):
+                potential_bugs.append({
+                    'line_number': line_number,
+                    'line_content': line_clean,
+                    'bug_type': 'size_check_error',
+                    'description': f'Size check on line {line_number} might prevent returning expected {expected_count} items',
+                    'suggested_fix': 'Review the size comparison logic',
+                    'confidence': 'medium'
+                })
+
+            # Look for empty return statements in conditional blocks
+            if 'return' in line_clean and self._is_empty_return(line_clean, line_lower):
+                potential_bugs.append({
+                    'line_number': line_number,
+                    'line_content': line_clean,
+                    'bug_type': 'empty_return',
+                    'description': 'Empty return statement might be executed when data should be returned',
+                    'suggested_fix': 'Check if this return should be conditional',
+                    'confidence': 'medium'
+                })
 
         return potential_bugs
 
+    @staticmethod
+    def _count_comparison_bugs(line_clean: str, line_number: int, expected_count: int) -> List[Dict]:
+        """Flag "count > N" style conditions that would reject the expected item count."""
+        bugs = []
+        # Check for common logic errors
+        for operator, pattern in _COUNT_CMP_PATTERNS.items():
+            if operator not in line_clean:
+                continue
+            # Simple pattern matching for "if (count > N)"
+            match = pattern.search(line_clean)
+            if match:
+                comparison_value = int(match.group(1))
+
+                # Flag potential off-by-one errors
+                if operator in ['>', '>='] and comparison_value >= expected_count:
+                    bugs.append({
+                        'line_number': line_number,
+                        'line_content': line_clean,
+                        'bug_type': 'off_by_one_error',
+                        'description': f'Condition requires count {operator} {comparison_value}, but test expects {expected_count} items',
+                        'suggested_fix': f'Change to "count > 0" or "count >= {expected_count}"',
+                        'confidence': 'high'
+                    })
+        return bugs
+
+    @staticmethod
+    def _is_empty_return(line_clean: str, line_lower: str) -> bool:
+        """Check whether a return statement hands back an empty collection."""
+        return (
+            'empty' in line_lower or 'new arraylist()' in line_lower or
+            'collections.emptylist()' in line_lower or 'return [];' in line_clean
+        )
+
     def generate_prompt(self, failure_data: Dict[str, Any]) -> str:
         """Generate a prompt for the AI model based on failure data."""
-        prompt = "You are a Java debugging expert. Analyze the test failure and provide EXACT CODE FIXES that can be directly applied.\n\n"
-        prompt += "IMPORTANT: Provide specific file paths, line numbers, and exact code replacements in this format:\n"
-        prompt += "FILE: path/to/file.java\n"
-        prompt += "LINE: 123\n"
-        prompt += "REPLACE: old code here\n"
-        prompt += "WITH: new code here\n\n"
+        parts: List[str] = ["You are a Java debugging expert. Analyze the test failure and provide EXACT CODE FIXES that can be directly applied.\n\n"]
+        parts.append("IMPORTANT: Provide specific file paths, line numbers, and exact code replacements in this format:\n")
+        parts.append("FILE: path/to/file.java\n")
+        parts.append("LINE: 123\n")
+        parts.append("REPLACE: old code here\n")
+        parts.append("WITH: new code here\n\n")
 
         # Add summary information
         summary = failure_data.get("summary", {})
-        prompt += f"**Test Summary:**\n"
-        prompt += f"- Total tests: {summary.get('total_tests', 'N/A')}\n"
-        prompt += f"- Failures: {summary.get('total_failures', 'N/A')}\n"
-        prompt += f"- Success rate: {summary.get('success_rate_percent', 'N/A')}%\n\n"
+        parts.append(f"**Test Summary:**\n")
+        parts.append(f"- Total tests: {summary.get('total_tests', 'N/A')}\n")
+        parts.append(f"- Failures: {summary.get('total_failures', 'N/A')}\n")
+        parts.append(f"- Success rate: {summary.get('success_rate_percent', 'N/A')}%\n\n")
+
+        # Resolve related files for every failure up front and load each distinct
+        # file once; failures of the same test class usually share most of them
+        failed_suites = [suite for suite in failure_data.get("suites", []) if suite.get("failures")]
+        related_by_failure: Dict[int, List[str]] = {}
+        for suite in failed_suites:
+            for failure in suite["failures"]:
+                related_by_failure[id(failure)] = self.find_related_source_files(
+                    failure['test_class'],
+                    failure.get('failure_message', ''),
+                    failure.get('stack_trace', ''),
+                    failure.get("test_source", {}).get("path")
+                )
+        unique_files = list(dict.fromkeys(path for paths in related_by_failure.values() for path in paths))
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_files) or 1)) as executor:
+            source_cache: Dict[str, str] = dict(zip(unique_files, executor.map(self.load_source_code, unique_files)))
 
         # Add failure details
-        for suite in failure_data.get("suites", []):
-            if suite.get("failures"):
-                prompt += f"**Failed Test Suite: {suite['name']}**\n\n"
-
-                for failure in suite["failures"]:
-                    prompt += f"**Test Method:** {failure['test_method']}\n"
-                    prompt += f"**Failure Type:** {failure['failure_type']}\n"
-                    prompt += f"**Error Message:** {failure['failure_message']}\n"
-
-                    if failure.get('failure_location'):
-                        prompt += f"**Location:** {failure['failure_location']['file']}:{failure['failure_location']['line']}\n\n"
-
-                    # Add assertion details if available
-                    if failure.get("assertion_details"):
-                        assertion = failure["assertion_details"]
-                        prompt += f"**Assertion Details:**\n"
-                        prompt += f"- Expected: {assertion.get('expected')}\n"
-                        prompt += f"- Actual: {assertion.get('actual')}\n\n"
-
-                    # Add test source context
-                    if failure.get("test_source", {}).get("context"):
-                        prompt += f"**Test Source Code:**\n```java\n{failure['test_source']['context']}\n```\n\n"
-
-                    # Find and include related source code from the implementation
-                    test_file_path = failure.get("test_source", {}).get("path")
-                    related_files = self.find_related_source_files(
-                        failure['test_class'],
-                        failure.get('failure_message', ''),
-                        failure.get('stack_trace', ''),
-                        test_file_path
-                    )
-
-                    # Analyze related source files for potential logic bugs
-                    all_potential_bugs = []
-                    for related_file in related_files:
-                        source_code = self.load_source_code(related_file)
-                        if source_code:
-                            prompt += f"**Related Source Code ({related_file}):**\n```java\n{source_code}\n```\n\n"
-
-                            # Analyze this source file for potential bugs
-                            bugs = self.analyze_code_for_logic_bugs(source_code, failure)
-                            if bugs:
-                                all_potential_bugs.extend([(related_file, bug) for bug in bugs])
-
-                    # Add potential bug analysis to prompt
-                    if all_potential_bugs:
-                        prompt += "**🚨 POTENTIAL LOGIC BUGS DETECTED:**\n"
-                        for file_path, bug in all_potential_bugs:
-                            prompt += f"- **{bug['bug_type']}** in {file_path}:{bug['line_number']}\n"
-                            prompt += f"  Line: `{bug['line_content']}`\n"
-                            prompt += f"  Issue: {bug['description']}\n"
-                            prompt += f"  Suggested Fix: {bug['suggested_fix']}\n"
-                            prompt += f"  Confidence: {bug['confidence']}\n\n"
-
-                    # Add environment info
-                    if suite.get("environment"):
-                        env = suite["environment"]
-                        prompt += f"**Environment:**\n"
-                        prompt += f"- Java Version: {env.get('java.version', 'N/A')}\n"
-                        prompt += f"- OS: {env.get('os.name', 'N/A')} {env.get('os.version', 'N/A')}\n\n"
-
-        prompt += "REQUIRED OUTPUT FORMAT:\n"
-        prompt += "1. **ROOT CAUSE**: Brief explanation of what's wrong\n"
-        prompt += "2. **EXACT FIXES**: For each file that needs changes:\n"
-        prompt += "   FILE: exact/path/to/file.java\n"
-        prompt += "   LINE: line_number\n"
-        prompt += "   REPLACE: exact_current_code\n"
-        prompt += "   WITH: exact_new_code\n\n"
-        prompt += "3. **VERIFICATION**: How to verify the fix works\n\n"
-        prompt += "Focus on providing executable, copy-paste ready code fixes.\n"
-
-        return prompt
+        for suite in failed_suites:
+            parts.append(f"**Failed Test Suite: {suite['name']}**\n\n")
+
+            for failure in suite["failures"]:
+                parts.append(f"**Test Method:** {failure['test_method']}\n")
+                parts.append(f"**Failure Type:** {failure['failure_type']}\n")
+                parts.append(f"**Error Message:** {failure['failure_message']}\n")
+
+                if failure.get('failure_location'):
+                    parts.append(f"**Location:** {failure['failure_location']['file']}:{failure['failure_location']['line']}\n\n")
+
+                # Add assertion details if available
+                if failure.get("assertion_details"):
+                    assertion = failure["assertion_details"]
+                    parts.append(f"**Assertion Details:**\n")
+                    parts.append(f"- Expected: {assertion.get('expected')}\n")
+                    parts.append(f"- Actual: {assertion.get('actual')}\n\n")
+
+                # Add test source context
+                if failure.get("test_source", {}).get("context"):
+                    parts.append(f"**Test Source Code:**\n```java\n{failure['test_source']['context']}\n```\n\n")
+
+                # Include related source code and analyze it for potential logic bugs
+                all_potential_bugs = []
+                for related_file in related_by_failure[id(failure)]:
+                    source_code = source_cache[related_file]
+                    if source_code:
+                        parts.append("**Related Source Code (")
+                        parts.append(related_file)
+                        parts.append("):**\n```java\n")
+                        parts.append(source_code)
+                        parts.append("\n```\n\n")
+
+                        # Analyze this source file for potential bugs
+                        bugs = self.analyze_code_for_logic_bugs(source_code, failure)
+                        if bugs:
+                            all_potential_bugs.extend([(related_file, bug) for bug in bugs])
+
+                # Add potential bug analysis to prompt
+                if all_potential_bugs:
+                    parts.append("**🚨 POTENTIAL LOGIC BUGS DETECTED:**\n")
+                    for file_path, bug in all_potential_bugs:
+                        parts.append(f"- **{bug['bug_type']}** in {file_path}:{bug['line_number']}\n")
+                        parts.append(f"  Line: `{bug['line_content']}`\n")
+                        parts.append(f"  Issue: {bug['description']}\n")
+                        parts.append(f"  Suggested Fix: {bug['suggested_fix']}\n")
+                        parts.append(f"  Confidence: {bug['confidence']}\n\n")
+
+                # Add environment info
+                if suite.get("environment"):
+                    env = suite["environment"]
+                    parts.append(f"**Environment:**\n")
+                    parts.append(f"- Java Version: {env.get('java.version', 'N/A')}\n")
+                    parts.append(f"- OS: {env.get('os.name', 'N/A')} {env.get('os.version', 'N/A')}\n\n")
+
+        parts.append("REQUIRED OUTPUT FORMAT:\n")
+        parts.append("1. **ROOT CAUSE**: Brief explanation of what's wrong\n")
+        parts.append("2. **EXACT FIXES**: For each file that needs changes:\n")
+        parts.append("   FILE: exact/path/to/file.java\n")
+        parts.append("   LINE: line_number\n")
+        parts.append("   REPLACE: exact_current_code\n")
+        parts.append("   WITH: exact_new_code\n\n")
+        parts.append("3. **VERIFICATION**: How to verify the fix works\n\n")
+        parts.append("Focus on providing executable, copy-paste ready code fixes.\n")
+
+        return ''.join(parts)
 
     def call_watsonx_ai(self, access_token: str, prompt: str) -> str:
         """Make API call to watsonx.ai to get fix suggestions."""
+        import requests
+
         url = "https://us-south.ml.cloud.ibm.com/ml/v1/text/chat?version=2024-03-14"
 
         headers = {
@@ -1122,16 +1320,35 @@ class FixSuggester:
         }
 
         try:
-            response = requests.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-
-            result = response.json()
+            # Stream the body so an oversized response is rejected before it is
+            # buffered; chunked responses carry no Content-Length to check
+            with self._get_http().post(url, json=payload, headers=headers, timeout=(5, 120),
+                                       stream=True) as response:
+                response.raise_for_status()
+
+                if int(response.headers.get('Content-Length') or 0) > _MAX_AI_RESPONSE_BYTES:
+                    Logger.error("watsonx.ai returned an oversized response")
+                    sys.exit(1)
+
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    received += len(chunk)
+                    if received > _MAX_AI_RESPONSE_BYTES:
+                        Logger.error("watsonx.ai returned an oversized response")
+                        sys.exit(1)
+                    chunks.append(chunk)
+
+            result = json.loads(b''.join(chunks))
             # Extract the AI response from the API response
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"]
             else:
                 return "No response received from the AI model"
 
+        except requests.exceptions.Timeout:
+            Logger.error("watsonx.ai API call timed out")
+            sys.exit(1)
         except requests.exceptions.RequestException as e:
             Logger.error(f"watsonx.ai API call failed: {e}")
             if hasattr(e, 'response') and e.response is not None:
@@ -1143,97 +1360,50 @@ class FixSuggester:
 
     def parse_ai_response(self, ai_response: str, failure_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse AI response into structured JSON format."""
-        fixes = []
-
-        # Split response into lines for parsing
-        lines = ai_response.split('\n')
-
-        # Variables to track current fix being parsed
-        current_fix = {}
-        root_cause = ""
-        verification = ""
-        additional_notes = ""
-        in_root_cause = False
-        in_verification = False
-        in_notes = False
-
-        # Parse the AI response line by line
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-
-            # Check for ROOT CAUSE section
-            if '**ROOT CAUSE' in line or 'ROOT CAUSE:' in line:
-                in_root_cause = True
-                in_verification = False
-                in_notes = False
-                continue
-
-            # Check for EXACT FIXES section
-            if '**EXACT FIXES' in line or 'EXACT FIXES:' in line:
-                in_root_cause = False
-                in_verification = False
-                in_notes = False
-                continue
-
-            # Check for VERIFICATION section
-            if '**VERIFICATION' in line or 'VERIFICATION:' in line:
-                in_verification = True
-                in_root_cause = False
-                in_notes = False
-                continue
+        # Collect the prose of each section, one space between non-empty lines
+        sections = {'ROOT CAUSE': [], 'EXACT FIXES': [], 'VERIFICATION': [], 'ADDITIONAL NOTES': []}
+        headings = list(_AI_SECTION_RE.finditer(ai_response))
+        for heading, next_heading in zip(headings, headings[1:] + [None]):
+            body = ai_response[heading.end():next_heading.start() if next_heading else len(ai_response)]
+            sections[heading.group('bold') or heading.group('colon')].extend(
+                line.strip() for line in body.split('\n') if line.strip()
+            )
+        root_cause = ' '.join(sections['ROOT CAUSE'])
+        verification = ' '.join(sections['VERIFICATION'])
+        additional_notes = ' '.join(sections['ADDITIONAL NOTES'])
 
-            # Check for ADDITIONAL NOTES section
-            if '**ADDITIONAL NOTES' in line or 'ADDITIONAL NOTES:' in line:
-                in_notes = True
-                in_root_cause = False
-                in_verification = False
+        # Parse FILE, LINE, REPLACE, WITH blocks; each label applies to the most
+        # recent FILE, and text between labels is ignored
+        fixes = []
+        current_fix: Dict[str, Any] = {}
+        consumed = 0
+        for match in _AI_FIX_LABEL_RE.finditer(ai_response):
+            # Labels inside a fenced value belong to the code, not the fix
+            if match.start() < consumed:
                 continue
+            label, value = match.group('label'), match.group('rest').strip()
 
-            # Capture root cause
-            if in_root_cause and line_stripped:
-                root_cause += line_stripped + " "
-
-            # Capture verification
-            if in_verification and line_stripped:
-                verification += line_stripped + " "
-
-            # Capture additional notes
-            if in_notes and line_stripped:
-                additional_notes += line_stripped + " "
-
-            # Parse FILE, LINE, REPLACE, WITH pattern
-            if line_stripped.startswith('FILE:'):
-                # Save previous fix if exists
-                if current_fix and 'file_path' in current_fix:
-                    fixes.append(current_fix)
-
-                # Start new fix
-                current_fix = {
-                    'file_path': line_stripped.replace('FILE:', '').strip()
-                }
-            elif line_stripped.startswith('LINE:'):
-                if current_fix:
-                    try:
-                        current_fix['line_number'] = int(line_stripped.replace('LINE:', '').strip())
-                    except ValueError:
-                        current_fix['line_number'] = line_stripped.replace('LINE:', '').strip()
-            elif line_stripped.startswith('REPLACE:'):
-                if current_fix:
-                    # Capture the REPLACE content (might be multi-line)
-                    replace_content = line_stripped.replace('REPLACE:', '').strip()
-                    if replace_content.startswith('`'):
-                        replace_content = replace_content.strip('`')
-                    current_fix['current_code'] = replace_content
-            elif line_stripped.startswith('WITH:'):
+            if label == 'FILE':
                 if current_fix:
-                    # Capture the WITH content (might be multi-line)
-                    with_content = line_stripped.replace('WITH:', '').strip()
-                    if with_content.startswith('`'):
-                        with_content = with_content.strip('`')
-                    current_fix['fixed_code'] = with_content
-
-        # Don't forget the last fix
-        if current_fix and 'file_path' in current_fix:
+                    fixes.append(current_fix)
+                current_fix = {'file_path': value}
+            elif not current_fix:
+                continue
+            elif label == 'LINE':
+                try:
+                    current_fix['line_number'] = int(value)
+                except ValueError:
+                    current_fix['line_number'] = value
+            else:
+                block = _AI_FIX_BLOCK_RE.match(ai_response, match.end('label') + 1)
+                if block:
+                    value = block.group('block')
+                    consumed = block.end()
+                elif value.startswith('`'):
+                    value = value.strip('`')
+                current_fix['current_code' if label == 'REPLACE' else 'fixed_code'] = value
+
+        if current_fix:
             fixes.append(current_fix)
 
         # Extract test information from failure_data
@@ -1292,9 +1462,12 @@ class FixSuggester:
         # Parse AI response into structured JSON
         structured_fixes = self.parse_ai_response(ai_response, failure_data)
 
-        # Save results as JSON
+        # Save results as JSON (compact unless --pretty; the HTML reports don't care about whitespace)
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(structured_fixes, f, indent=2)
+            if self.pretty_json:
+                json.dump(structured_fixes, f, indent=2)
+            else:
+                json.dump(structured_fixes, f, separators=(',', ':'))
 
         Logger.success(f"Fixes saved to {output_file}")
 
@@ -1311,8 +1484,9 @@ class FixSuggester:
             print("  Review the raw AI response in the output file")
             return
 
+        lines = []
         for i, fix in enumerate(fixes, 1):
-            file_name = fix.get('file_path', 'Unknown').split('/')[-1]
+            file_name = os.path.basename(fix.get('file_path', 'Unknown'))
             line_num = fix.get('line_number', '?')
             test_method = fix.get('test_method', '')
 
@@ -1326,9 +1500,12 @@ class FixSuggester:
 
             # Display with test context if available
             if test_method:
-                print(f"  {i}. {file_name}:{line_num} - {issue} (Test: {test_method})")
+                lines.append(f"  {i}. {file_name}:{line_num} - {issue} (Test: {test_method})")
             else:
-                print(f"  {i}. {file_name}:{line_num} - {issue}")
+                lines.append(f"  {i}. {file_name}:{line_num} - {issue}")
+
+        # Emit the whole list with one write instead of a print per fix
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         # Show metadata
         metadata = structured_fixes.get('metadata', {})
@@ -1337,15 +1514,29 @@ class FixSuggester:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Analyze Maven test failures and suggest fixes')
+    parser.add_argument('mode', nargs='?', choices=['analyze', 'suggest'],
+                        help='Run only the test analysis or only the fix suggestions (default: both)')
+    parser.add_argument('--pretty', action='store_true', help='Pretty-print the JSON error summary and suggested fixes (compact by default)')
+    args = parser.parse_args()
+
+    if args.mode == 'analyze':
+        MavenTestAnalyzer(pretty_json=args.pretty).run_analysis()
+        return
+
+    if args.mode == 'suggest':
+        FixSuggester(pretty_json=args.pretty).suggest_fixes()
+        return
+
     # Run both analysis and suggestions
     Logger.info("Starting Maven test error analysis and fix suggestion workflow")
 
     # Step 1: Analyze tests
-    analyzer = MavenTestAnalyzer()
+    analyzer = MavenTestAnalyzer(pretty_json=args.pretty)
     has_failures = analyzer.run_analysis()
 
     if has_failures:
-        suggester = FixSuggester()
+        suggester = FixSuggester(pretty_json=args.pretty)
         suggester.suggest_fixes()
     else:
         Logger.info("No failures to suggest fixes for")
@@ -6,55 +6,77 @@ Generates professional HTML reports from the JSON output of the fix_errors.py sc
 Uses HTML5 Boilerplate, Tailwind CSS, and IBM Design System colors.
 """
 
+import html
 import json
 import os
-from datetime import datetime
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, Callable, Iterable, Iterator, List
 import argparse
-
-
-class HTMLReportGenerator:
-    """Generates professional HTML reports from test analysis JSON data."""
-
-    def __init__(self, output_dir: str = "output"):
-        self.output_dir = output_dir
-        self.ibm_colors = {
-            'primary': '#0f62fe',
-            'primary_hover': '#0353e9',
-            'secondary': '#393939',
-            'success': '#198038',
-            'warning': '#f1c21b',
-            'error': '#da1e28',
-            'info': '#0043ce',
-            'gray_10': '#f4f4f4',
-            'gray_20': '#e0e0e0',
-            'gray_30': '#c6c6c6',
-            'gray_50': '#8d8d8d',
-            'gray_70': '#525252',
-            'gray_90': '#262626',
-            'gray_100': '#161616'
-        }
-
-    def load_json_data(self) -> Dict[str, Any]:
-        """Load both error summary and suggested fixes JSON files."""
-        data = {}
-
-        error_summary_path = os.path.join(self.output_dir, 'error-summary.json')
-        fixes_path = os.path.join(self.output_dir, 'suggested-fixes.json')
-
-        if os.path.exists(error_summary_path):
-            with open(error_summary_path, 'r') as f:
-                data['error_summary'] = json.load(f)
-
-        if os.path.exists(fixes_path):
-            with open(fixes_path, 'r') as f:
-                data['suggested_fixes'] = json.load(f)
-
-        return data
-
-    def get_base_html_template(self, title: str, additional_styles: str = "") -> str:
-        """Returns the base HTML5 template with Tailwind CSS and IBM colors."""
-        return f'''<!DOCTYPE html>
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+
+def _esc(value: Any) -> str:
+    """Escape a report value for use in HTML text or a double-quoted attribute."""
+    return html.escape(str(value))
+
+
+def _js_literal(value: Any) -> str:
+    """Encode a value as JSON that is safe inside a <script> block or a single-quoted attribute."""
+    return (json.dumps(value)
+            .replace('&', '\\u0026').replace('<', '\\u003c')
+            .replace('>', '\\u003e').replace("'", '\\u0027'))
+
+
+# IBM Design System palette
+_IBM_COLORS = {
+    'primary': '#0f62fe',
+    'primary_hover': '#0353e9',
+    'secondary': '#393939',
+    'success': '#198038',
+    'warning': '#f1c21b',
+    'error': '#da1e28',
+    'info': '#0043ce',
+    'gray_10': '#f4f4f4',
+    'gray_20': '#e0e0e0',
+    'gray_30': '#c6c6c6',
+    'gray_50': '#8d8d8d',
+    'gray_70': '#525252',
+    'gray_90': '#262626',
+    'gray_100': '#161616'
+}
+
+# CSS variable exposed by the pages for each palette entry they use
+_IBM_CSS_VARIABLES = (
+    ('ibm-blue', 'primary'),
+    ('ibm-blue-hover', 'primary_hover'),
+    ('ibm-gray-10', 'gray_10'),
+    ('ibm-gray-20', 'gray_20'),
+    ('ibm-gray-30', 'gray_30'),
+    ('ibm-gray-50', 'gray_50'),
+    ('ibm-gray-70', 'gray_70'),
+    ('ibm-gray-90', 'gray_90'),
+    ('ibm-gray-100', 'gray_100'),
+    ('ibm-success', 'success'),
+    ('ibm-warning', 'warning'),
+    ('ibm-error', 'error'),
+)
+
+# The :root block is expanded from the palette once at import so pages never format it at render time
+_IBM_ROOT_CSS = '        :root {\n' + ''.join(
+    f'            --{name}: {_IBM_COLORS[key]};\n' for name, key in _IBM_CSS_VARIABLES
+) + '        }'
+
+
+# Page skeleton shared by every report. Literal braces are doubled for str.format,
+# which fills in root_css once at import; title and additional_styles are spliced in per page.
+_BASE_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en" class="h-full">
 <head>
     <meta charset="UTF-8">
@@ -63,20 +85,7 @@ class HTMLReportGenerator:
     <script src="https://cdn.tailwindcss.com"></script>
     <link href="https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <style>
-        :root {{
-            --ibm-blue: {self.ibm_colors['primary']};
-            --ibm-blue-hover: {self.ibm_colors['primary_hover']};
-            --ibm-gray-10: {self.ibm_colors['gray_10']};
-            --ibm-gray-20: {self.ibm_colors['gray_20']};
-            --ibm-gray-30: {self.ibm_colors['gray_30']};
-            --ibm-gray-50: {self.ibm_colors['gray_50']};
-            --ibm-gray-70: {self.ibm_colors['gray_70']};
-            --ibm-gray-90: {self.ibm_colors['gray_90']};
-            --ibm-gray-100: {self.ibm_colors['gray_100']};
-            --ibm-success: {self.ibm_colors['success']};
-            --ibm-warning: {self.ibm_colors['warning']};
-            --ibm-error: {self.ibm_colors['error']};
-        }}
+{root_css}
 
         body {{
             font-family: 'IBM Plex Sans', sans-serif;
@@ -142,9 +151,21 @@ class HTMLReportGenerator:
 </head>
 <body class="h-full">'''
 
-    def get_header_nav(self) -> str:
-        """Returns the navigation header."""
-        return '''
+# Closes the content wrapper opened after the page header
+_PAGE_FOOTER = '''
+        </div>
+    </main>
+</body>
+</html>'''
+
+
+# Report file names, also linked from the navigation header
+_DASHBOARD_FILE = 'test-analysis-dashboard.html'
+_DETAILED_RESULTS_FILE = 'test-results-detailed.html'
+_FIX_SUGGESTIONS_FILE = 'fix-suggestions.html'
+
+# Navigation header shared by every report, linked to the file names above at import
+_HEADER_NAV = '''
     <header class="ibm-primary text-white shadow-lg">
         <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
             <div class="flex justify-between items-center py-6">
@@ -152,302 +173,137 @@ class HTMLReportGenerator:
                     <h1 class="text-2xl font-bold">Maven Test Analysis</h1>
                 </div>
                 <nav class="hidden md:flex space-x-8">
-                    <a href="test-analysis-dashboard.html" class="hover:text-gray-300 transition">Dashboard</a>
-                    <a href="test-results-detailed.html" class="hover:text-gray-300 transition">Test Results</a>
-                    <a href="fix-suggestions.html" class="hover:text-gray-300 transition">Fix Suggestions</a>
+                    <a href="{dashboard}" class="hover:text-gray-300 transition">Dashboard</a>
+                    <a href="{detailed_results}" class="hover:text-gray-300 transition">Test Results</a>
+                    <a href="{fix_suggestions}" class="hover:text-gray-300 transition">Fix Suggestions</a>
                 </nav>
             </div>
         </div>
-    </header>'''
-
-    def generate_dashboard(self, data: Dict[str, Any]) -> str:
-        """Generate the main dashboard HTML."""
-        if 'error_summary' not in data:
-            return self.generate_no_data_page("Dashboard")
+    </header>'''.format(
+    dashboard=_DASHBOARD_FILE,
+    detailed_results=_DETAILED_RESULTS_FILE,
+    fix_suggestions=_FIX_SUGGESTIONS_FILE
+)
 
-        summary = data['error_summary']['summary']
-        metadata = data['error_summary']['metadata']
-        suites = data['error_summary']['suites']
 
-        # Calculate metrics
-        success_rate = summary['success_rate_percent']
-        status_color = 'ibm-success' if success_rate == 100 else 'ibm-warning' if success_rate >= 80 else 'ibm-error'
-
-        html = self.get_base_html_template("Maven Test Analysis - Dashboard")
-        html += self.get_header_nav()
-
-        html += f'''
-    <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
-        <div class="px-4 py-6 sm:px-0">
-            <!-- Page Header -->
-            <div class="mb-8">
-                <h1 class="text-3xl font-bold text-gray-900">Test Analysis Dashboard</h1>
-                <p class="mt-2 text-sm text-gray-600">Generated on {metadata['generated_at']}</p>
-            </div>
-
-            <!-- KPI Cards -->
-            <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">
+# One dashboard KPI card; the four cards differ only in color, icon, label and value
+_KPI_CARD_TEMPLATE = '''
                 <div class="bg-white overflow-hidden shadow rounded-lg card-shadow">
                     <div class="p-5">
                         <div class="flex items-center">
                             <div class="flex-shrink-0">
-                                <div class="w-8 h-8 {status_color} rounded-full flex items-center justify-center">
-                                    <span class="text-white font-bold">✓</span>
+                                <div class="w-8 h-8 {color} rounded-full flex items-center justify-center">
+                                    <span class="text-white font-bold">{icon}</span>
                                 </div>
                             </div>
                             <div class="ml-5 w-0 flex-1">
                                 <dl>
-                                    <dt class="text-sm font-medium text-gray-500 truncate">Success Rate</dt>
-                                    <dd class="text-lg font-medium text-gray-900">{success_rate:.1f}%</dd>
+                                    <dt class="text-sm font-medium text-gray-500 truncate">{label}</dt>
+                                    <dd class="text-lg font-medium text-gray-900">{value}</dd>
                                 </dl>
                             </div>
                         </div>
                     </div>
                 </div>
+'''
 
-                <div class="bg-white overflow-hidden shadow rounded-lg card-shadow">
-                    <div class="p-5">
-                        <div class="flex items-center">
-                            <div class="flex-shrink-0">
-                                <div class="w-8 h-8 ibm-primary rounded-full flex items-center justify-center">
-                                    <span class="text-white font-bold">#</span>
-                                </div>
-                            </div>
-                            <div class="ml-5 w-0 flex-1">
-                                <dl>
-                                    <dt class="text-sm font-medium text-gray-500 truncate">Total Tests</dt>
-                                    <dd class="text-lg font-medium text-gray-900">{summary['total_tests']}</dd>
-                                </dl>
-                            </div>
-                        </div>
-                    </div>
-                </div>
 
-                <div class="bg-white overflow-hidden shadow rounded-lg card-shadow">
-                    <div class="p-5">
-                        <div class="flex items-center">
-                            <div class="flex-shrink-0">
-                                <div class="w-8 h-8 ibm-error rounded-full flex items-center justify-center">
-                                    <span class="text-white font-bold">✗</span>
-                                </div>
-                            </div>
-                            <div class="ml-5 w-0 flex-1">
-                                <dl>
-                                    <dt class="text-sm font-medium text-gray-500 truncate">Failures</dt>
-                                    <dd class="text-lg font-medium text-gray-900">{summary['total_failures']}</dd>
-                                </dl>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="bg-white overflow-hidden shadow rounded-lg card-shadow">
-                    <div class="p-5">
-                        <div class="flex items-center">
-                            <div class="flex-shrink-0">
-                                <div class="w-8 h-8 bg-gray-400 rounded-full flex items-center justify-center">
-                                    <span class="text-white font-bold">⏱</span>
-                                </div>
-                            </div>
-                            <div class="ml-5 w-0 flex-1">
-                                <dl>
-                                    <dt class="text-sm font-medium text-gray-500 truncate">Execution Time</dt>
-                                    <dd class="text-lg font-medium text-gray-900">{summary['total_time_seconds']:.2f}s</dd>
-                                </dl>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Test Suites Overview -->
-            <div class="bg-white shadow rounded-lg card-shadow">
-                <div class="px-4 py-5 sm:p-6">
-                    <h3 class="text-lg leading-6 font-medium text-gray-900 mb-4">Test Suites Overview</h3>
-                    <div class="overflow-x-auto">
-                        <table class="min-w-full divide-y divide-gray-200">
-                            <thead class="bg-gray-50">
-                                <tr>
-                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Suite Name</th>
-                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Status</th>
-                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Tests</th>
-                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Time</th>
-                                </tr>
-                            </thead>
-                            <tbody class="bg-white divide-y divide-gray-200">'''
-
-        for suite in suites:
-            suite_name = suite['name'].split('.')[-1]  # Get just the class name
-            status_badge = 'status-passed' if suite['status'] == 'PASSED' else 'status-failed'
-
-            html += f'''
+# One row of the dashboard suites table
+_SUITE_ROW_TEMPLATE = '''
                                 <tr>
                                     <td class="px-6 py-4 whitespace-nowrap">
-                                        <div class="text-sm font-medium text-gray-900">{suite_name}</div>
-                                        <div class="text-sm text-gray-500">{suite['name']}</div>
+                                        <div class="text-sm font-medium text-gray-900">{short_name}</div>
+                                        <div class="text-sm text-gray-500">{name}</div>
                                     </td>
                                     <td class="px-6 py-4 whitespace-nowrap">
                                         <span class="inline-flex px-2 py-1 text-xs font-semibold rounded-full {status_badge}">
-                                            {suite['status']}
+                                            {status}
                                         </span>
                                     </td>
-                                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{suite['tests']}</td>
-                                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{suite['time_seconds']:.2f}s</td>
+                                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{tests}</td>
+                                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{time_seconds:.2f}s</td>
                                 </tr>'''
 
-        html += '''
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-</body>
-</html>'''
-
-        return html
-
-    def generate_detailed_results(self, data: Dict[str, Any]) -> str:
-        """Generate the detailed test results HTML."""
-        if 'error_summary' not in data:
-            return self.generate_no_data_page("Test Results")
-
-        summary = data['error_summary']['summary']
-        metadata = data['error_summary']['metadata']
-        suites = data['error_summary']['suites']
-
-        html = self.get_base_html_template("Maven Test Analysis - Detailed Results")
-        html += self.get_header_nav()
-
-        html += f'''
-    <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
-        <div class="px-4 py-6 sm:px-0">
-            <!-- Page Header -->
-            <div class="mb-8">
-                <h1 class="text-3xl font-bold text-gray-900">Detailed Test Results</h1>
-                <p class="mt-2 text-sm text-gray-600">Generated on {metadata['generated_at']} | {summary['total_tests']} tests across {metadata['total_suites']} suites</p>
-            </div>'''
-
-        for i, suite in enumerate(suites):
-            suite_name = suite['name'].split('.')[-1]
-            status_badge = 'status-passed' if suite['status'] == 'PASSED' else 'status-failed'
-
-            html += f'''
-            <!-- Test Suite {i+1} -->
+# Detailed results suite card up to the environment entries
+_SUITE_CARD_HEAD_TEMPLATE = '''
+            <!-- Test Suite {number} -->
             <div class="bg-white shadow rounded-lg card-shadow mb-6">
                 <div class="px-4 py-5 sm:p-6">
                     <div class="flex items-center justify-between mb-4">
                         <div>
-                            <h3 class="text-lg leading-6 font-medium text-gray-900">{suite_name}</h3>
-                            <p class="text-sm text-gray-500">{suite['name']}</p>
+                            <h3 class="text-lg leading-6 font-medium text-gray-900">{short_name}</h3>
+                            <p class="text-sm text-gray-500">{name}</p>
                         </div>
                         <span class="inline-flex px-3 py-1 text-sm font-semibold rounded-full {status_badge}">
-                            {suite['status']}
+                            {status}
                         </span>
                     </div>
 
                     <div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-4">
                         <div class="text-center">
-                            <div class="text-2xl font-bold text-gray-900">{suite['tests']}</div>
+                            <div class="text-2xl font-bold text-gray-900">{tests}</div>
                             <div class="text-sm text-gray-500">Tests</div>
                         </div>
                         <div class="text-center">
-                            <div class="text-2xl font-bold text-green-600">{len([f for f in suite.get('failures', [])])}</div>
+                            <div class="text-2xl font-bold text-green-600">{failure_count}</div>
                             <div class="text-sm text-gray-500">Failures</div>
                         </div>
                         <div class="text-center">
-                            <div class="text-2xl font-bold text-red-600">{suite['errors']}</div>
+                            <div class="text-2xl font-bold text-red-600">{errors}</div>
                             <div class="text-sm text-gray-500">Errors</div>
                         </div>
                         <div class="text-center">
-                            <div class="text-2xl font-bold text-gray-600">{suite['time_seconds']:.2f}s</div>
+                            <div class="text-2xl font-bold text-gray-600">{time_seconds:.2f}s</div>
                             <div class="text-sm text-gray-500">Duration</div>
                         </div>
                     </div>
 
                     <!-- Environment Info (Collapsible) -->
                     <div class="border-t pt-4">
-                        <button onclick="toggleSection('env-{i}')" class="flex items-center text-sm font-medium text-gray-700 hover:text-gray-900">
-                            <span id="env-{i}-icon" class="mr-2">▶</span>
+                        <button onclick="toggleSection('env-{index}')" class="flex items-center text-sm font-medium text-gray-700 hover:text-gray-900">
+                            <span id="env-{index}-icon" class="mr-2">▶</span>
                             Environment Information
                         </button>
-                        <div id="env-{i}" class="hidden mt-3 bg-gray-50 rounded p-3">
+                        <div id="env-{index}" class="hidden mt-3 bg-gray-50 rounded p-3">
                             <div class="grid grid-cols-1 md:grid-cols-2 gap-4 text-sm">'''
 
-            for key, value in suite.get('environment', {}).items():
-                html += f'''
+# One environment property inside a suite card
+_ENV_ROW_TEMPLATE = '''
                                 <div>
                                     <span class="font-medium text-gray-700">{key}:</span>
                                     <span class="text-gray-900">{value}</span>
                                 </div>'''
 
-            html += f'''
+# Remainder of a suite card after the environment entries
+_SUITE_CARD_TAIL_TEMPLATE = '''
                             </div>
                         </div>
                     </div>
 
                     <!-- Suite Log (Collapsible) -->
                     <div class="border-t pt-4 mt-4">
-                        <button onclick="toggleSection('log-{i}')" class="flex items-center text-sm font-medium text-gray-700 hover:text-gray-900">
-                            <span id="log-{i}-icon" class="mr-2">▶</span>
+                        <button onclick="toggleSection('log-{index}')" class="flex items-center text-sm font-medium text-gray-700 hover:text-gray-900">
+                            <span id="log-{index}-icon" class="mr-2">▶</span>
                             Suite Log
                         </button>
-                        <div id="log-{i}" class="hidden mt-3">
-                            <pre class="code-block p-4 rounded text-sm overflow-x-auto">{suite.get('suite_log_excerpt', 'No log available')}</pre>
+                        <div id="log-{index}" class="hidden mt-3">
+                            <pre class="code-block p-4 rounded text-sm overflow-x-auto">{log_excerpt}</pre>
                         </div>
                     </div>
                 </div>
             </div>'''
 
-        html += '''
-        </div>
-    </main>
-</body>
-</html>'''
-
-        return html
-
-    def generate_fix_suggestions(self, data: Dict[str, Any]) -> str:
-        """Generate the fix suggestions HTML."""
-        if 'suggested_fixes' not in data:
-            return self.generate_no_data_page("Fix Suggestions")
-
-        fixes_data = data['suggested_fixes']
-        metadata = fixes_data['metadata']
-        fixes = fixes_data.get('fixes', [])
-
-        html = self.get_base_html_template("Maven Test Analysis - Fix Suggestions")
-        html += self.get_header_nav()
-
-        html += f'''
-    <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
-        <div class="px-4 py-6 sm:px-0">
-            <!-- Page Header -->
-            <div class="mb-8">
-                <h1 class="text-3xl font-bold text-gray-900">AI-Generated Fix Suggestions</h1>
-                <p class="mt-2 text-sm text-gray-600">Generated on {metadata['generated_at']} | {len(fixes)} fix(es) suggested</p>
-            </div>'''
-
-        if not fixes:
-            html += '''
-            <div class="bg-green-50 border border-green-200 rounded-lg p-6 text-center">
-                <div class="text-green-600 text-6xl mb-4">✓</div>
-                <h2 class="text-xl font-semibold text-green-800 mb-2">All Tests Passing!</h2>
-                <p class="text-green-700">No fixes needed. Your test suite is running successfully.</p>
-            </div>'''
-        else:
-            for i, fix in enumerate(fixes):
-                html += f'''
-            <!-- Fix {i+1} -->
+# One suggested fix on the fix suggestions page
+_FIX_CARD_TEMPLATE = '''
+            <!-- Fix {number} -->
             <div class="bg-white shadow rounded-lg card-shadow mb-6">
                 <div class="px-4 py-5 sm:p-6">
                     <div class="flex items-start justify-between mb-4">
                         <div>
-                            <h3 class="text-lg leading-6 font-medium text-gray-900">Fix #{i+1}</h3>
-                            <p class="text-sm text-gray-500">{fix['test_class']}.{fix['test_method']}</p>
+                            <h3 class="text-lg leading-6 font-medium text-gray-900">Fix #{number}</h3>
+                            <p class="text-sm text-gray-500">{test_class}.{test_method}</p>
                         </div>
-                        <button onclick="copyToClipboard(`{fix['fixed_code']}`)"
+                        <button onclick="copyToClipboard(window.__fixes[{index}].fixed_code)"
                                 class="ibm-primary ibm-primary-hover text-white px-3 py-1 text-sm rounded hover:bg-blue-700 transition">
                             Copy Fix
                         </button>
@@ -456,8 +312,8 @@ class HTMLReportGenerator:
                     <!-- File and Line Info -->
                     <div class="bg-blue-50 border border-blue-200 rounded-lg p-4 mb-4">
                         <div class="flex items-center">
-                            <div class="text-blue-600 font-medium">📁 {fix['file_path']}</div>
-                            <div class="ml-4 text-blue-600">Line {fix['line_number']}</div>
+                            <div class="text-blue-600 font-medium">📁 {file_path}</div>
+                            <div class="ml-4 text-blue-600">Line {line_number}</div>
                         </div>
                     </div>
 
@@ -465,7 +321,7 @@ class HTMLReportGenerator:
                     <div class="mb-6">
                         <h4 class="text-md font-semibold text-gray-900 mb-2">Root Cause Analysis</h4>
                         <div class="bg-yellow-50 border border-yellow-200 rounded-lg p-4">
-                            <p class="text-gray-800">{fix['root_cause']}</p>
+                            <p class="text-gray-800">{root_cause}</p>
                         </div>
                     </div>
 
@@ -473,11 +329,11 @@ class HTMLReportGenerator:
                     <div class="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-6">
                         <div>
                             <h4 class="text-md font-semibold text-red-700 mb-2">❌ Current Code</h4>
-                            <pre class="code-block p-4 rounded text-sm overflow-x-auto border-2 border-red-200">{fix['current_code']}</pre>
+                            <pre class="code-block p-4 rounded text-sm overflow-x-auto border-2 border-red-200">{current_code}</pre>
                         </div>
                         <div>
                             <h4 class="text-md font-semibold text-green-700 mb-2">✅ Fixed Code</h4>
-                            <pre class="code-block p-4 rounded text-sm overflow-x-auto border-2 border-green-200">{fix['fixed_code']}</pre>
+                            <pre class="code-block p-4 rounded text-sm overflow-x-auto border-2 border-green-200">{fixed_code}</pre>
                         </div>
                     </div>
 
@@ -485,26 +341,249 @@ class HTMLReportGenerator:
                     <div class="border-t pt-4">
                         <h4 class="text-md font-semibold text-gray-900 mb-2">Verification Steps</h4>
                         <div class="bg-gray-50 rounded-lg p-4">
-                            <p class="text-gray-800">{fix['verification']}</p>
+                            <p class="text-gray-800">{verification}</p>
                         </div>
                     </div>
                 </div>
             </div>'''
 
-        html += '''
+
+# The skeleton split around the per-page title and extra styles
+_HEAD_PRE, _HEAD_MID, _HEAD_POST = (
+    part.format(root_css=_IBM_ROOT_CSS)
+    for part in re.split(r'\{title\}|\{additional_styles\}', _BASE_HTML_TEMPLATE)
+)
+
+
+class HTMLReportGenerator:
+    """Generates professional HTML reports from test analysis JSON data."""
+
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = output_dir
+        self._error_summary_path = os.path.join(output_dir, 'error-summary.json')
+        self._fixes_path = os.path.join(output_dir, 'suggested-fixes.json')
+
+    @property
+    def ibm_colors(self) -> Dict[str, str]:
+        """IBM Design System colors used by the reports."""
+        return dict(_IBM_COLORS)
+
+    def load_json_data(self) -> Dict[str, Any]:
+        """Load both error summary and suggested fixes JSON files."""
+        data = {}
+        error_summary_path, fixes_path = self._error_summary_path, self._fixes_path
+
+        # Read raw bytes: orjson parses them directly and json.loads detects UTF-8
+        if os.path.isfile(error_summary_path):
+            with open(error_summary_path, 'rb') as f:
+                data['error_summary'] = _json_loads(f.read())
+
+            # Both suite pages show the bare class name; derive it once here
+            for suite in data['error_summary'].get('suites', []):
+                name = suite['name']
+                suite['short_name'] = name.rpartition('.')[2] or name
+
+        if os.path.isfile(fixes_path):
+            with open(fixes_path, 'rb') as f:
+                data['suggested_fixes'] = _json_loads(f.read())
+
+        return data
+
+    def get_base_html_template(self, title: str, additional_styles: str = "") -> str:
+        """Returns the base HTML5 template with Tailwind CSS and IBM colors."""
+        return ''.join((_HEAD_PRE, title, _HEAD_MID, additional_styles, _HEAD_POST))
+
+    def get_header_nav(self) -> str:
+        """Returns the navigation header."""
+        return _HEADER_NAV
+
+    def generate_dashboard(self, data: Dict[str, Any]) -> str:
+        """Generate the main dashboard HTML."""
+        return ''.join(self._dashboard_chunks(data))
+
+    def _iter_dashboard(self, summary: Dict[str, Any], metadata: Dict[str, Any],
+                        suites: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the main dashboard HTML in chunks."""
+        # Calculate metrics
+        success_rate = summary['success_rate_percent']
+        status_color = 'ibm-success' if success_rate == 100 else 'ibm-warning' if success_rate >= 80 else 'ibm-error'
+
+        yield self.get_base_html_template("Maven Test Analysis - Dashboard")
+        yield _HEADER_NAV
+
+        yield f'''
+    <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
+        <div class="px-4 py-6 sm:px-0">
+            <!-- Page Header -->
+            <div class="mb-8">
+                <h1 class="text-3xl font-bold text-gray-900">Test Analysis Dashboard</h1>
+                <p class="mt-2 text-sm text-gray-600">Generated on {_esc(metadata['generated_at'])}</p>
+            </div>
+
+            <!-- KPI Cards -->
+            <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">'''
+        yield ''.join(
+            _KPI_CARD_TEMPLATE.format(color=color, icon=icon, label=label, value=value)
+            for color, icon, label, value in (
+                (status_color, '✓', 'Success Rate', f"{success_rate:.1f}%"),
+                ('ibm-primary', '#', 'Total Tests', summary['total_tests']),
+                ('ibm-error', '✗', 'Failures', summary['total_failures']),
+                ('bg-gray-400', '⏱', 'Execution Time', f"{summary['total_time_seconds']:.2f}s"),
+            )
+        )
+        yield '''            </div>
+
+            <!-- Test Suites Overview -->
+            <div class="bg-white shadow rounded-lg card-shadow">
+                <div class="px-4 py-5 sm:p-6">
+                    <h3 class="text-lg leading-6 font-medium text-gray-900 mb-4">Test Suites Overview</h3>
+                    <div class="overflow-x-auto">
+                        <table class="min-w-full divide-y divide-gray-200">
+                            <thead class="bg-gray-50">
+                                <tr>
+                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Suite Name</th>
+                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Status</th>
+                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Tests</th>
+                                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Time</th>
+                                </tr>
+                            </thead>
+                            <tbody class="bg-white divide-y divide-gray-200">'''
+
+        for suite in suites:
+            status = suite['status']
+            status_badge = 'status-passed' if status == 'PASSED' else 'status-failed'
+
+            yield _SUITE_ROW_TEMPLATE.format(
+                short_name=_esc(suite['short_name']),
+                name=_esc(suite['name']),
+                status_badge=status_badge,
+                status=_esc(status),
+                tests=suite['tests'],
+                time_seconds=suite['time_seconds']
+            )
+
+        yield '''
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            </div>
         </div>
     </main>
 </body>
 </html>'''
 
-        return html
+    def generate_detailed_results(self, data: Dict[str, Any]) -> str:
+        """Generate the detailed test results HTML."""
+        return ''.join(self._detailed_results_chunks(data))
+
+    def _iter_detailed_results(self, summary: Dict[str, Any], metadata: Dict[str, Any],
+                               suites: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the detailed test results HTML in chunks."""
+        yield self.get_base_html_template("Maven Test Analysis - Detailed Results")
+        yield _HEADER_NAV
+
+        yield f'''
+    <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
+        <div class="px-4 py-6 sm:px-0">
+            <!-- Page Header -->
+            <div class="mb-8">
+                <h1 class="text-3xl font-bold text-gray-900">Detailed Test Results</h1>
+                <p class="mt-2 text-sm text-gray-600">Generated on {_esc(metadata['generated_at'])} | {summary['total_tests']} tests across {metadata['total_suites']} suites</p>
+            </div>'''
+
+        for i, suite in enumerate(suites):
+            # Read every field once; the card below only touches locals
+            name = suite['name']
+            short_name = suite['short_name']
+            status = suite['status']
+            tests = suite['tests']
+            errors = suite['errors']
+            time_seconds = suite['time_seconds']
+            failure_count = len(suite.get('failures') or ())
+            environment = suite.get('environment', {})
+            log_excerpt = suite.get('suite_log_excerpt', 'No log available')
+            status_badge = 'status-passed' if status == 'PASSED' else 'status-failed'
+
+            # Assemble each suite card in a list and hand it to the writer in one piece
+            parts = [_SUITE_CARD_HEAD_TEMPLATE.format(
+                number=i + 1,
+                index=i,
+                short_name=_esc(short_name),
+                name=_esc(name),
+                status_badge=status_badge,
+                status=_esc(status),
+                tests=tests,
+                failure_count=failure_count,
+                errors=errors,
+                time_seconds=time_seconds
+            )]
+
+            for key, value in environment.items():
+                parts.append(_ENV_ROW_TEMPLATE.format(key=_esc(key), value=_esc(value)))
+
+            parts.append(_SUITE_CARD_TAIL_TEMPLATE.format(index=i, log_excerpt=_esc(log_excerpt)))
+            yield ''.join(parts)
+
+        yield _PAGE_FOOTER
+
+    def generate_fix_suggestions(self, data: Dict[str, Any]) -> str:
+        """Generate the fix suggestions HTML."""
+        return ''.join(self._fix_suggestions_chunks(data))
+
+    def _iter_fix_suggestions(self, metadata: Dict[str, Any], fixes: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the fix suggestions HTML in chunks."""
+        yield self.get_base_html_template("Maven Test Analysis - Fix Suggestions")
+        yield _HEADER_NAV
+
+        yield f'''
+    <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
+        <div class="px-4 py-6 sm:px-0">
+            <!-- Page Header -->
+            <div class="mb-8">
+                <h1 class="text-3xl font-bold text-gray-900">AI-Generated Fix Suggestions</h1>
+                <p class="mt-2 text-sm text-gray-600">Generated on {_esc(metadata['generated_at'])} | {len(fixes)} fix(es) suggested</p>
+            </div>'''
+
+        if not fixes:
+            yield '''
+            <div class="bg-green-50 border border-green-200 rounded-lg p-6 text-center">
+                <div class="text-green-600 text-6xl mb-4">✓</div>
+                <h2 class="text-xl font-semibold text-green-800 mb-2">All Tests Passing!</h2>
+                <p class="text-green-700">No fixes needed. Your test suite is running successfully.</p>
+            </div>'''
+        else:
+            for i, fix in enumerate(fixes):
+                yield _FIX_CARD_TEMPLATE.format(
+                    number=i + 1,
+                    index=i,
+                    test_class=_esc(fix['test_class']),
+                    test_method=_esc(fix['test_method']),
+                    file_path=_esc(fix['file_path']),
+                    line_number=_esc(fix['line_number']),
+                    root_cause=_esc(fix['root_cause']),
+                    current_code=_esc(fix['current_code']),
+                    fixed_code=_esc(fix['fixed_code']),
+                    verification=_esc(fix['verification'])
+                )
+
+            # The copy buttons read the code from one JSON block instead of inline JS strings
+            yield f'''
+            <script type="application/json" id="fix-data">{_js_literal([{'fixed_code': fix['fixed_code']} for fix in fixes])}</script>
+            <script>window.__fixes = JSON.parse(document.getElementById('fix-data').textContent);</script>'''
+
+        yield _PAGE_FOOTER
 
     def generate_no_data_page(self, page_type: str) -> str:
         """Generate a page when no data is available."""
-        html = self.get_base_html_template(f"Maven Test Analysis - {page_type}")
-        html += self.get_header_nav()
+        return ''.join(self._iter_no_data_page(page_type))
 
-        html += f'''
+    def _iter_no_data_page(self, page_type: str) -> Iterator[str]:
+        """Yield the page shown when no data is available."""
+        yield self.get_base_html_template(f"Maven Test Analysis - {page_type}")
+        yield _HEADER_NAV
+
+        yield f'''
     <main class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
         <div class="px-4 py-6 sm:px-0">
             <div class="text-center">
@@ -517,40 +596,126 @@ class HTMLReportGenerator:
 </body>
 </html>'''
 
-        return html
+    def _is_up_to_date(self, output_path: str, input_path: str) -> bool:
+        """Check whether a report is newer than its JSON input and this generator.
+
+        _write_report only ever renames finished pages into place, so an existing
+        page is always complete. Modification times are only meaningful for files
+        this generator wrote: after a git checkout of the output directory every
+        file carries a checkout-time mtime, so run with --force to rebuild.
+        """
+        try:
+            output_mtime = os.stat(output_path).st_mtime_ns
+            input_mtime = max(
+                os.stat(input_path).st_mtime_ns,
+                os.stat(__file__).st_mtime_ns
+            )
+        except FileNotFoundError:
+            return False
+        return output_mtime > input_mtime
+
+    def _dashboard_chunks(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Unpack the error summary and return the dashboard chunk iterator."""
+        if 'error_summary' not in data:
+            return self._iter_no_data_page("Dashboard")
+        error_summary = data['error_summary']
+        return self._iter_dashboard(error_summary['summary'], error_summary['metadata'], error_summary['suites'])
+
+    def _detailed_results_chunks(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Unpack the error summary and return the detailed results chunk iterator."""
+        if 'error_summary' not in data:
+            return self._iter_no_data_page("Test Results")
+        error_summary = data['error_summary']
+        return self._iter_detailed_results(error_summary['summary'], error_summary['metadata'], error_summary['suites'])
 
-    def generate_all_reports(self):
-        """Generate all HTML reports."""
-        print("Loading JSON data...")
-        data = self.load_json_data()
+    def _fix_suggestions_chunks(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Unpack the suggested fixes and return the fix suggestions chunk iterator."""
+        if 'suggested_fixes' not in data:
+            return self._iter_no_data_page("Fix Suggestions")
+        suggested_fixes = data['suggested_fixes']
+        return self._iter_fix_suggestions(suggested_fixes['metadata'], suggested_fixes.get('fixes', []))
+
+    def _render_pages(self, data: Dict[str, Any]) -> Dict[str, Callable[[], Iterator[str]]]:
+        """Map every report file to a callable that unpacks only its own document when invoked."""
+        return {
+            _DASHBOARD_FILE: partial(self._dashboard_chunks, data),
+            _DETAILED_RESULTS_FILE: partial(self._detailed_results_chunks, data),
+            _FIX_SUGGESTIONS_FILE: partial(self._fix_suggestions_chunks, data)
+        }
 
+    def _write_report(self, output_path: str, render: Callable[[], Iterable[str]]) -> str:
+        """Write one report page as it is rendered rather than materializing it first.
+
+        The page streams into a temporary file next to the target, which replaces
+        the target only once rendering has finished, so a failure never leaves a
+        truncated page behind.
+        """
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb', buffering=1 << 20) as f:
+                f.writelines(chunk.encode('utf-8') for chunk in render())
+            os.replace(temp_path, output_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        return output_path
+
+    def generate_all_reports(self, force: bool = False):
+        """Generate all HTML reports, skipping those whose inputs have not changed unless forced."""
         reports = [
-            ('test-analysis-dashboard.html', self.generate_dashboard(data)),
-            ('test-results-detailed.html', self.generate_detailed_results(data)),
-            ('fix-suggestions.html', self.generate_fix_suggestions(data))
+            (_DASHBOARD_FILE, self._error_summary_path),
+            (_DETAILED_RESULTS_FILE, self._error_summary_path),
+            (_FIX_SUGGESTIONS_FILE, self._fixes_path)
         ]
 
-        for filename, html_content in reports:
+        stale_reports = []
+        for filename, input_path in reports:
             output_path = os.path.join(self.output_dir, filename)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            print(f"Generated: {output_path}")
+            if not force and self._is_up_to_date(output_path, input_path):
+                print(f"Up to date: {output_path}")
+            else:
+                stale_reports.append((filename, output_path))
+
+        if not stale_reports:
+            print(f"\n✅ All reports in {self.output_dir}/ are up to date")
+            return
+
+        print("Loading JSON data...")
+        pages = self._render_pages(self.load_json_data())
+
+        # The pages share read-only data and write separate files, so render them concurrently
+        with ThreadPoolExecutor(max_workers=len(stale_reports)) as executor:
+            writes = [executor.submit(self._write_report, output_path, pages[filename])
+                      for filename, output_path in stale_reports]
+            # A broken input only fails its own page; the others are still written
+            errors = []
+            for write in writes:
+                try:
+                    print(f"Generated: {write.result()}")
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
 
         print(f"\n✅ All reports generated successfully in {self.output_dir}/")
-        print("📊 Dashboard: test-analysis-dashboard.html")
-        print("📋 Test Results: test-results-detailed.html")
-        print("🔧 Fix Suggestions: fix-suggestions.html")
+        print(f"📊 Dashboard: {_DASHBOARD_FILE}")
+        print(f"📋 Test Results: {_DETAILED_RESULTS_FILE}")
+        print(f"🔧 Fix Suggestions: {_FIX_SUGGESTIONS_FILE}")
 
 
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Generate HTML reports from Maven test analysis JSON data')
     parser.add_argument('--output-dir', default='output', help='Output directory containing JSON files')
+    parser.add_argument('--force', action='store_true', help='Regenerate reports even if their JSON input is unchanged (required after a git checkout of the output directory)')
 
     args = parser.parse_args()
 
     generator = HTMLReportGenerator(args.output_dir)
-    generator.generate_all_reports()
+    generator.generate_all_reports(force=args.force)
 
 
 if __name__ == '__main__':